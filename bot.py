@@ -17,21 +17,39 @@ Supports two modes:
 """
 
 import os
+import re
+import signal
 import sys
 import logging
-from dotenv import load_dotenv
-from pybit import exceptions
-from pybit.unified_trading import HTTP
-from helpers import BybitHelper
-from tests import test_connection
-from strategies import run_trailing_stop_strategy, run_trailing_stop_strategy_whitelist
+from pybit import exceptions  # lightweight, doesn't load the HTTP client
+from config import get_credentials
 from logger import setup_logger
 
-load_dotenv()
-
-API_KEY = os.getenv("API_KEY")
-SECRET_KEY = os.getenv("SECRET_KEY")
 WHITELIST_FILE = "whitelist.txt"
+# Whole alphabetic tokens separated by commas and/or whitespace
+_COIN_RE = re.compile(r"(?<![^,\s])[A-Za-z]+(?![^,\s])")
+# Log message builders for API errors, looked up by exception class
+_ERROR_FORMATTERS = {
+    exceptions.InvalidRequestError: lambda e: f"ByBit request error | {e.status_code} | {e.message}",
+    exceptions.FailedRequestError: lambda e: f"Execution error | {e.status_code} | {e.message}",
+}
+
+
+def format_error(error: Exception) -> str:
+    """
+    Build log message for an error raised while running the bot
+
+    Args:
+        error: Raised exception
+
+    Returns:
+        str: Message for the error log
+    """
+    for cls in type(error).__mro__:
+        formatter = _ERROR_FORMATTERS.get(cls)
+        if formatter is not None:
+            return formatter(error)
+    return f"Execution error | {str(error)}"
 
 
 def print_usage():
@@ -54,7 +72,7 @@ def load_whitelist():
     Load coin whitelist from file.
 
     Returns:
-        list: List of coin names from whitelist file
+        tuple: Coin names from whitelist file, in file order without duplicates
 
     Raises:
         FileNotFoundError: If whitelist.txt doesn't exist
@@ -72,9 +90,8 @@ def load_whitelist():
     if not content:
         raise ValueError(f"Whitelist file '{WHITELIST_FILE}' is empty")
 
-    # Parse coins and clean them up
-    coins = [coin.strip().upper() for coin in content.split(',')]
-    coins = [coin for coin in coins if coin and coin.isalpha()]  # Remove empty strings and invalid symbols
+    # Parse coins in one pass, skipping empty values and invalid symbols
+    coins = tuple(dict.fromkeys(coin.upper() for coin in _COIN_RE.findall(content)))
 
     if not coins:
         # More detailed error message based on content
@@ -142,19 +159,29 @@ def main():
             print(f"Error loading whitelist: {str(e)}")
             sys.exit(1)
 
+    # Import API and strategy modules only after arguments are validated,
+    # so usage errors don't pay for loading pandas, numpy and pybit
+    from helpers import BybitHelper
+    from http_client import get_client
+    from tests import test_connection
+    from strategies import (
+        run_trailing_stop_strategy,
+        run_trailing_stop_strategy_whitelist,
+        stop_strategies,
+    )
+
+    # Let the strategy finish its iteration and save the position on SIGTERM
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_strategies())
+
     # Set up logging
     setup_logger(logging_identifier, buy_amount)
 
     try:
-        if not API_KEY or not SECRET_KEY:
+        api_key, secret_key = get_credentials()
+        if not api_key or not secret_key:
             raise ValueError("API_KEY or SECRET_KEY not found in environment variables")
 
-        client = HTTP(
-            api_key=API_KEY,
-            api_secret=SECRET_KEY,
-            recv_window=60000,
-            return_response_headers=True,
-        )
+        client = get_client(api_key, secret_key)
 
         helper = BybitHelper(client)
 
@@ -178,12 +205,8 @@ def main():
             # Start trading algorithm for whitelist
             run_trailing_stop_strategy_whitelist(helper, coin_whitelist, buy_amount)
 
-    except exceptions.InvalidRequestError as e:
-        logging.error(f"ByBit request error | {e.status_code} | {e.message}")
-    except exceptions.FailedRequestError as e:
-        logging.error(f"Execution error | {e.status_code} | {e.message}")
     except Exception as e:
-        logging.error(f"Execution error | {str(e)}")
+        logging.error(format_error(e))
 
 
 if __name__ == "__main__":
@@ -4,26 +4,20 @@ Test runner for Bybit API functionality
 This module runs tests by importing functions from tests.py
 """
 
-import os
 import sys
 import logging
-from dotenv import load_dotenv
-from pybit.unified_trading import HTTP
+from config import get_credentials
 from helpers import BybitHelper
+from http_client import get_client
 from logger import setup_logger
 from tests import test_connection, test_place_order
 
-load_dotenv()
-
-API_KEY = os.getenv("API_KEY")
-SECRET_KEY = os.getenv("SECRET_KEY")
-
 
 def test_orderbook():
     """
     Test getting orderbook data without authentication
     """
-    cl = HTTP()
+    cl = get_client()
     r = cl.get_orderbook(category="spot", symbol="BTCUSDT")
     print("Orderbook test:")
     print(r)
@@ -54,13 +48,9 @@ def main():
     test_orderbook()
     
     # Test with authentication if keys are available
-    if API_KEY and SECRET_KEY:
-        client = HTTP(
-            api_key=API_KEY,
-            api_secret=SECRET_KEY,
-            recv_window=60000,
-            return_response_headers=True,
-        )
+    api_key, secret_key = get_credentials()
+    if api_key and secret_key:
+        client = get_client(api_key, secret_key)
         
         helper = BybitHelper(client)
         
@@ -0,0 +1,165 @@
+"""
+Response cache for idempotent Bybit API calls
+
+This module provides a small TTL cache kept in memory and
+persisted to disk, so answers that stay valid for a while
+(instrument specs, closed candles) survive bot restarts and
+don't cost a network round-trip or API rate limit.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "bybit_bot")
+# Time to live in seconds for each cached endpoint
+DEFAULT_TTL = {
+    "instruments_info": 86400,  # lot size and precision rules rarely change
+    "kline": 60,  # the newest candle is still open
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _hash_key(endpoint: str, items: tuple) -> str:
+    # Repeated lookups (e.g. instrument info on every order) skip the hashing
+    digest = hashlib.md5(json.dumps(items).encode("utf-8")).hexdigest()
+    return f"{endpoint}-{digest}"
+
+
+class FileCache:
+    """
+    TTL cache keyed on endpoint and request parameters
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, ttl_map: dict | None = None):
+        """
+        Initialize cache
+
+        Args:
+            directory (str, optional): Directory for cache files. Defaults to CACHE_DIR
+            ttl_map (dict, optional): Time to live in seconds per endpoint. Defaults to DEFAULT_TTL
+        """
+        self.directory = directory
+        self.ttl_map = DEFAULT_TTL if ttl_map is None else ttl_map
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(endpoint: str, params: dict) -> str:
+        """
+        Build cache key for a request
+
+        Args:
+            endpoint (str): Endpoint name (e.g. "kline")
+            params (dict): Request parameters
+
+        Returns:
+            str: Cache key
+        """
+        return _hash_key(endpoint, tuple(sorted(params.items())))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, endpoint: str, params: dict):
+        """
+        Get cached value if it hasn't expired
+
+        Args:
+            endpoint (str): Endpoint name (e.g. "kline")
+            params (dict): Request parameters
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        key = self._key(endpoint, params)
+        now = time.time()
+
+        entry = self._entries.get(key)
+        if entry is None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    entry = pickle.load(f)
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                logging.warning(f"Could not load cache entry {key}: {str(e)}")
+                return None
+            self._entries[key] = entry
+
+        expires_at, value = entry
+        if expires_at < now:
+            return None
+        return value
+
+    def set(self, endpoint: str, params: dict, value):
+        """
+        Store value in memory and on disk
+
+        Args:
+            endpoint (str): Endpoint name (e.g. "kline")
+            params (dict): Request parameters
+            value: Value to cache
+        """
+        key = self._key(endpoint, params)
+        entry = (time.time() + self.ttl_map.get(endpoint, 0), value)
+        self._entries[key] = entry
+
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                path = self._path(key)
+                tmp_file = f"{path}.tmp"
+                with open(tmp_file, "wb") as f:
+                    pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, path)
+            except OSError as e:
+                logging.warning(f"Could not save cache entry {key}: {str(e)}")
+
+    def invalidate(self, endpoint: str, params: dict):
+        """
+        Drop cached value
+
+        Args:
+            endpoint (str): Endpoint name (e.g. "kline")
+            params (dict): Request parameters
+        """
+        key = self._key(endpoint, params)
+        self._entries.pop(key, None)
+        with self._lock:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning(f"Could not remove cache entry {key}: {str(e)}")
+
+    def get_or_fetch(self, endpoint: str, params: dict, fetch, is_valid=None):
+        """
+        Get cached value or fetch and cache it
+
+        Args:
+            endpoint (str): Endpoint name (e.g. "kline")
+            params (dict): Request parameters
+            fetch: Function without arguments performing the request
+            is_valid (optional): Predicate deciding whether a fetched value may be cached
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        if endpoint not in self.ttl_map:
+            return fetch()
+
+        value = self.get(endpoint, params)
+        if value is not None:
+            return value
+
+        value = fetch()
+        if is_valid is None or is_valid(value):
+            self.set(endpoint, params, value)
+        return value
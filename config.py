@@ -0,0 +1,23 @@
+"""
+Bot configuration
+
+This module reads API credentials from environment variables,
+loading them from a .env file once per process.
+"""
+
+import functools
+import os
+
+from dotenv import load_dotenv
+
+
+@functools.lru_cache(maxsize=1)
+def get_credentials() -> tuple:
+    """
+    Get Bybit API credentials
+
+    Returns:
+        tuple: (api_key, secret_key), None for values that are not set
+    """
+    load_dotenv()
+    return os.getenv("API_KEY"), os.getenv("SECRET_KEY")
@@ -6,14 +6,141 @@ including functions for getting account information, logging transfers,
 and monitoring API limits.
 """
 
+import hashlib
+import hmac
+import json
+import logging
+import math
+import sys
+import time
+from decimal import Decimal
+
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
+from pybit.exceptions import InvalidRequestError
 from pybit.unified_trading import HTTP
 
+from cache import FileCache
+from http_client import PooledHTTP, configure_session
+
+try:
+    import orjson
+except ImportError:  # optional dependency, falls back to stdlib json
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # optional dependency, falls back to pure Python
+    njit = None
+
+# Powers of ten for rounding, indexed by number of decimal places
+POW10 = tuple(10**i for i in range(19))
+# Order rejection codes caused by outdated lot size / precision rules
+INSTRUMENT_MISMATCH_CODES = {170136, 170137, 170140}
+# Field positions in a kline row [startTime, open, high, low, close, volume, turnover]
+KLINE_START = 0
+KLINE_OPEN = 1
+KLINE_CLOSE = 4
+KLINE_FIELDS = 7
+# Seconds to reuse a fetched wallet in get_assets
+BALANCE_TTL = 2
+# Seconds to keep parsed lot size limits before re-reading instrument info
+LOT_FILTER_TTL = 3600
+# Transaction log types reported by get_transfers
+TRANSFER_TYPE_PREFIXES = ("TRANSFER",)
+TRANSFER_COLUMNS = ["currency", "type", "change", "cashBalance", "transactionTime"]
+# Column types for the transfers report; transactionTime stays in epoch ms
+# until after sorting
+TRANSFER_DTYPES = {
+    "currency": "category",
+    "type": "category",
+    "change": "float64",
+    "cashBalance": "float64",
+    "transactionTime": "int64",
+}
+
+
+def _truncate(value: float, multiplier: float) -> float:
+    scaled = value * multiplier
+    truncated = math.trunc(scaled)
+    # 0.29 * 100 == 28.999999999999996: a value that already has at most
+    # `decimals` places is kept rather than cut by one step. Only exact
+    # decimals qualify (29 / 100 == 0.29), so 0.9999999999995 still
+    # truncates to 0.99 and never rounds up past what is held
+    nearest = round(scaled)
+    if nearest != truncated and nearest / multiplier == value:
+        return value
+    return truncated / multiplier
+
+
+if njit is not None:
+    # Compiled once and cached on disk, so later runs skip the JIT cost
+    _truncate = njit("float64(float64, float64)", cache=True)(_truncate)
+
+
+def _unpack(api_result) -> tuple:
+    """
+    Split a pybit response into body and headers
+
+    pybit returns a bare dict, or a (response, elapsed, headers) tuple
+    when return_response_headers is enabled.
+
+    Args:
+        api_result: Result of a pybit HTTP call
+
+    Returns:
+        tuple: (response, headers), headers is None if not returned
+    """
+    if not isinstance(api_result, tuple):
+        return api_result, None
+    if len(api_result) == 3:
+        return api_result[0], api_result[2]
+    return api_result[0], None
+
+
+def _unwrap(response: dict, action: str = "Request") -> list:
+    """
+    Validate a response and return its result list
+
+    pybit already raises for most failed requests; this check keeps the
+    boundary explicit, so callers can index the returned list directly.
+
+    Args:
+        response: Response body from the API
+        action: Operation name used in the error message
+
+    Returns:
+        list: Value of result.list
+
+    Raises:
+        RuntimeError: If the response reports an error
+    """
+    if response.get("retCode", 0) != 0:
+        raise RuntimeError(f"{action} failed: {response.get('retMsg')}")
+    return response["result"]["list"]
+
+
+def _kline_array(candles: list) -> np.ndarray:
+    """
+    Parse kline rows into a float array
+
+    Args:
+        candles: Candles as returned by the API, values are numeric strings
+
+    Returns:
+        np.ndarray: Array of shape (len(candles), KLINE_FIELDS)
+    """
+    return np.asarray(candles, dtype=np.float64).reshape(-1, KLINE_FIELDS)
+
 
 class BybitHelper:
     """
     Helper class for working with Bybit API
+
+    All REST calls go through the client's single requests.Session, mounted
+    with the keep-alive adapter from http_client, so prices, candles and
+    orders reuse open TLS connections.
     """
 
     def __init__(self, client: HTTP | None = None):
@@ -24,19 +151,72 @@ class BybitHelper:
             client (HTTP, optional): Bybit HTTP client. Defaults to None
         """
         self.client = client
+        if client is not None:
+            # Reuse connections across helper calls even for plain pybit clients
+            configure_session(client.client)
+        self.cache = FileCache()
+        # (category, symbol) -> (expiry on monotonic clock, (min_order_qty, min_order_amt))
+        self._lot_filters = {}
+        # (category, symbol) -> decimal places of order quantity
+        self._quantity_decimals = {}
+        # (expiry on monotonic clock, {coin: available balance}) or None
+        self._balances = None
+
+    def invalidate_instrument_info(self, category: str, symbol: str):
+        """
+        Drop cached instrument information for a symbol
+
+        Args:
+            category (str): Market category (e.g. "spot", "linear")
+            symbol (str): Trading pair symbol (e.g. "BTCUSDT")
+        """
+        self._lot_filters.pop((category, symbol), None)
+        self._quantity_decimals.pop((category, symbol), None)
+        self.cache.invalidate("instruments_info", {"category": category, "symbol": symbol})
+
+    def _check_instrument_mismatch(self, category: str, symbol: str, response: dict):
+        """
+        Invalidate cached instrument information if an order was rejected
+        because of outdated lot size rules
+
+        Args:
+            category (str): Market category (e.g. "spot", "linear")
+            symbol (str): Trading pair symbol (e.g. "BTCUSDT")
+            response (dict): Order placement response
+        """
+        if response.get("retCode") in INSTRUMENT_MISMATCH_CODES:
+            self.invalidate_instrument_info(category, symbol)
 
     @staticmethod
-    def log_limits(headers: dict):
+    def log_limits(headers):
         """
         Log API request limits.
 
+        Does nothing if the headers are missing or carry no limit information.
+
         Args:
-            headers (dict): API response headers containing limit information
+            headers: API response headers (dict or CaseInsensitiveDict) containing limit information
+        """
+        if not headers:
+            return
+        status = headers.get("X-Bapi-Limit-Status")
+        limit = headers.get("X-Bapi-Limit")
+        if status is None and limit is None:
+            return
+        logging.debug("Limits %s / %s", status, limit)
+
+    def warm_up_connection(self):
         """
-        # print(
-        #     f"Limits {headers.get('X-Bapi-Limit-Status')} / {headers.get('X-Bapi-Limit')}"
-        # )
-        pass
+        Open a connection to the API ahead of time
+
+        Issues a lightweight server time request so DNS resolution and the
+        TCP+TLS handshake happen before the first order, and the connection
+        stays in the keep-alive pool.
+        """
+        if not self.client:
+            raise ValueError("HTTP client not initialized")
+
+        self.client.get_server_time()
 
     def assets(self):
         """
@@ -54,30 +234,25 @@ class BybitHelper:
 
         response = self.client.get_wallet_balance(accountType="UNIFIED")
         
-        # Handle different response formats from the API
-        if isinstance(response, tuple):
-            if len(response) == 3:
-                r, _, h = response
-            elif len(response) == 2:
-                r, _ = response
-                h = None
-            else:
-                r = response[0]
-                h = None
-        else:
-            r = response
-            h = None
+        r, h = _unpack(response)
 
-        r = r.get("result", {}).get("list", [])[0]
+        r = _unwrap(r, "Wallet balance retrieval")[0]
 
         total_balance = float(r.get("totalWalletBalance", "0.0"))
-        coins = [
-            f"{float(c.get('walletBalance', '0.0')):>12.6f} {c.get('coin'):>12}"
-            for c in r.get("coin", [])
-        ]
+        coin_list = r.get("coin", [])
+        # Convert all balances in one NumPy pass, then format rows with a bound template
+        balances = np.array(
+            [c.get("walletBalance", "0.0") for c in coin_list], dtype=np.float64
+        )
+        names = [c.get("coin") for c in coin_list]
+        # Largest holdings first, ties keep the API order
+        order = np.argsort(-balances, kind="stable").tolist()
+        coins = map("{:>12.6f} {:>12}".format, balances[order].tolist(), [names[i] for i in order])
 
-        print("\n".join(coins))
-        print(f"---\nTotal: {total_balance:>18.2f}\n")
+        # Emit the whole report with a single write
+        report = "\n".join(coins) + f"\n---\nTotal: {total_balance:>18.2f}\n\n"
+        sys.stdout.write(report)
+        sys.stdout.flush()
 
         # self.log_limits(h)
 
@@ -87,7 +262,9 @@ class BybitHelper:
 
         This function retrieves transfer transactions without pagination.
         Creates a DataFrame with transfer information and sorts
-        transactions by timestamp in descending order.
+        transactions by timestamp in descending order. A single page holds
+        at most 50 records, so the columnar pandas build is kept rather
+        than converting through pyarrow or polars.
 
         Returns:
             pandas.DataFrame: DataFrame containing transfer transaction details
@@ -97,40 +274,103 @@ class BybitHelper:
 
         response = self.client.get_transaction_log()
         
-        # Handle different response formats from the API
-        if isinstance(response, tuple):
-            if len(response) == 3:
-                r, _, h = response
-            elif len(response) == 2:
-                r, _ = response
-                h = None
-            else:
-                r = response[0]
-                h = None
-        else:
-            r = response
-            h = None
-
-        df = DataFrame(
-            [
-                {
-                    "currency": e.get("currency"),
-                    "type": e.get("type"),
-                    "change": e.get("change"),
-                    "cashBalance": e.get("cashBalance"),
-                    "transactionTime": int(e.get("transactionTime")),
-                }
-                for e in r.get("result", {}).get("list", [])
-                if e.get("type").startswith("TRANSFER")
-            ]
-        )
-
-        df["transactionTime"] = pd.to_datetime(df["transactionTime"], unit="ms")
-        df.sort_values(by=["transactionTime"], inplace=True, ascending=False)
-        print(df)
+        r, h = _unpack(response)
+
+        # Let .loc/.iloc selections share memory until written (default from
+        # pandas 3.0); scoped here so importing helpers changes no global option
+        with pd.option_context("mode.copy_on_write", True):
+            # from_records pivots the row dicts into columns in C and builds
+            # only the reported columns, then rows are filtered vectorized
+            df = DataFrame.from_records(_unwrap(r, "Transfers retrieval"), columns=TRANSFER_COLUMNS)
+            df = df.loc[df["type"].str.startswith(TRANSFER_TYPE_PREFIXES, na=False)]
+            df = df.astype(TRANSFER_DTYPES)
+
+            # Sort newest first on the raw millisecond timestamps and
+            # convert only the reordered column to datetime
+            timestamps = df["transactionTime"].to_numpy()
+            order = np.argsort(-timestamps, kind="stable")
+            df = df.iloc[order].assign(transactionTime=pd.to_datetime(timestamps[order], unit="ms"))
+        sys.stdout.write(df.to_string() + "\n")
+        sys.stdout.flush()
 
         # self.log_limits(h)
 
+    def _fetch_wallet_coins(self) -> list:
+        """
+        Request per-coin balances of the UNIFIED account
+
+        Returns:
+            list: Coin entries of the wallet, empty if the account has no coins
+
+        Raises:
+            ValueError: If client is not initialized
+            RuntimeError: If API response has unexpected format
+        """
+        if not self.client:
+            raise ValueError("HTTP client not initialized")
+
+        # API может возвращать разные форматы ответа
+        api_result = self.client.get_wallet_balance(accountType="UNIFIED")
+
+        response, headers = _unpack(api_result)
+        # self.log_limits(headers)
+
+        if not response:
+            raise RuntimeError("Empty response from API")
+
+        try:
+            return response["result"]["list"][0]["coin"]
+        except (KeyError, IndexError):
+            return []
+        except TypeError as e:
+            raise RuntimeError(f"Unexpected API response format: {str(e)}")
+
+    @staticmethod
+    def _parse_balances(coins_data: list, field: str) -> dict:
+        """
+        Build a balance dictionary from wallet coin entries
+
+        Args:
+            coins_data (list): Coin entries of the wallet
+            field (str): Balance field (e.g. "walletBalance", "availableToWithdraw")
+
+        Returns:
+            dict: Balance keyed by coin name, 0.0 for empty or invalid amounts
+        """
+        balances = {}
+        for asset in coins_data:
+            get = asset.get  # bind once per row
+            coin_name = get("coin")
+            if not coin_name:
+                continue
+            try:
+                balances[coin_name] = float(get(field) or 0.0)
+            except (ValueError, TypeError):
+                balances[coin_name] = 0.0
+        return balances
+
+    def get_all_balances(self) -> dict:
+        """
+        Get available balances for all coins on the account
+
+        The wallet is fetched once and the result is reused for
+        BALANCE_TTL seconds, or until an order is placed.
+
+        Returns:
+            dict: Available balance for withdrawal keyed by coin name
+
+        Raises:
+            ValueError: If client is not initialized
+            RuntimeError: If API response has unexpected format
+        """
+        cached = self._balances
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        balances = self._parse_balances(self._fetch_wallet_coins(), "availableToWithdraw")
+        self._balances = (time.monotonic() + BALANCE_TTL, balances)
+        return balances
+
     def get_assets(self, coin: str) -> float:
         """
         Get available balance for a specific coin on the account
@@ -145,72 +385,18 @@ class BybitHelper:
             ValueError: If client is not initialized or coin name is empty
             RuntimeError: If API response has unexpected format
         """
-        if not self.client:
-            raise ValueError("HTTP client not initialized")
         if not coin:
             raise ValueError("Coin name not specified")
 
-        try:
-            # API может возвращать разные форматы ответа
-            api_result = self.client.get_wallet_balance(accountType="UNIFIED")
-            
-            # Обработка различных форматов ответа API
-            if isinstance(api_result, tuple):
-                if len(api_result) == 3:
-                    response, _, headers = api_result
-                elif len(api_result) == 2:
-                    response, _ = api_result
-                    headers = None
-                else:
-                    response = api_result[0]
-                    headers = None
-            else:
-                response = api_result
-                headers = None
-                
-            if not response:
-                raise RuntimeError("Empty response from API")
-
-            # Get list of coins from response
-            account_data = response.get("result", {}).get("list", [])
-            if not account_data:
-                return 0.0
-
-            # Get coin information
-            coins_data = account_data[0].get("coin", [])
-            if not coins_data:
-                return 0.0
-
-            # Create a dictionary with coin balances
-            balances = {}
-            for asset in coins_data:
-                coin_name = asset.get("coin")
-                available_amount = asset.get("availableToWithdraw", "0.0")
-                
-                # Check if coin name exists and amount is not empty
-                if coin_name and available_amount and available_amount.strip():
-                    try:
-                        balances[coin_name] = float(available_amount)
-                    except (ValueError, TypeError):
-                        balances[coin_name] = 0.0
-                elif coin_name:
-                    balances[coin_name] = 0.0
-
-            # Log API limits
-            # self.log_limits(headers)
-
-            # Return balance for requested coin or 0.0 if coin not found
-            return self.round_down(balances.get(coin, 0.0), 3)
-
-        except (KeyError, IndexError) as e:
-            raise RuntimeError(f"Unexpected API response format: {str(e)}")
-        except ValueError as e:
-            raise RuntimeError(f"Value conversion error: {str(e)}")
+        return self.round_down(self.get_all_balances().get(coin, 0.0), 3)
 
     def get_wallet_balance(self, coin: str) -> float:
         """
         Get total wallet balance for a specific coin (including locked funds)
 
+        Always requests a fresh wallet, so it can be compared before and
+        after an order fills.
+
         Args:
             coin (str): Coin name (e.g. "BTC", "ETH", "USDT")
 
@@ -221,64 +407,42 @@ class BybitHelper:
             ValueError: If client is not initialized or coin name is empty
             RuntimeError: If API response has unexpected format
         """
-        if not self.client:
-            raise ValueError("HTTP client not initialized")
         if not coin:
             raise ValueError("Coin name not specified")
 
-        try:
-            # API может возвращать разные форматы ответа
-            api_result = self.client.get_wallet_balance(accountType="UNIFIED")
-            
-            # Обработка различных форматов ответа API
-            if isinstance(api_result, tuple):
-                if len(api_result) == 3:
-                    response, _, headers = api_result
-                elif len(api_result) == 2:
-                    response, _ = api_result
-                    headers = None
-                else:
-                    response = api_result[0]
-                    headers = None
-            else:
-                response = api_result
-                headers = None
-                
-            if not response:
-                raise RuntimeError("Empty response from API")
-
-            # Get list of coins from response
-            account_data = response.get("result", {}).get("list", [])
-            if not account_data:
-                return 0.0
-
-            # Get coin information
-            coins_data = account_data[0].get("coin", [])
-            if not coins_data:
-                return 0.0
-
-            # Create a dictionary with coin balances using walletBalance
-            balances = {}
-            for asset in coins_data:
-                coin_name = asset.get("coin")
-                wallet_balance = asset.get("walletBalance", "0.0")
-                
-                # Check if coin name exists and amount is not empty
-                if coin_name and wallet_balance and wallet_balance.strip():
-                    try:
-                        balances[coin_name] = float(wallet_balance)
-                    except (ValueError, TypeError):
-                        balances[coin_name] = 0.0
-                elif coin_name:
-                    balances[coin_name] = 0.0
-
-            # Return balance for requested coin or 0.0 if coin not found
-            return self.round_down(balances.get(coin, 0.0), 6)
-
-        except (KeyError, IndexError) as e:
-            raise RuntimeError(f"Unexpected API response format: {str(e)}")
-        except ValueError as e:
-            raise RuntimeError(f"Value conversion error: {str(e)}")
+        balances = self._parse_balances(self._fetch_wallet_coins(), "walletBalance")
+        return self.round_down(balances.get(coin, 0.0), 6)
+
+    def get_order(
+        self, category: str, order_id: str | None = None, order_link_id: str | None = None
+    ) -> dict | None:
+        """
+        Get an order from the order history
+
+        Args:
+            category (str): Market category (e.g. "spot")
+            order_id (str, optional): Order ID
+            order_link_id (str, optional): Client order ID, used if order_id is not given
+
+        Returns:
+            dict: Order record with orderStatus, cumExecQty and cumExecFee,
+                or None if the order isn't listed yet
+
+        Raises:
+            ValueError: If client is not initialized
+            RuntimeError: If the request fails
+        """
+        if not self.client:
+            raise ValueError("HTTP client not initialized")
+
+        if order_id is not None:
+            api_result = self.client.get_order_history(category=category, orderId=order_id)
+        else:
+            api_result = self.client.get_order_history(category=category, orderLinkId=order_link_id)
+        r, h = _unpack(api_result)
+
+        orders = _unwrap(r, "Order history retrieval")
+        return orders[0] if orders else None
 
     def place_order(
         self,
@@ -288,6 +452,7 @@ class BybitHelper:
         order_type: str,
         qty: float,
         market_unit: str = "quoteCoin",
+        order_link_id: str | None = None,
     ) -> dict:
         """
         Place an order
@@ -299,6 +464,8 @@ class BybitHelper:
             order_type (str): Order type (e.g. "Market", "Limit")
             qty (float): Order quantity
             market_unit (str, optional): Unit for market orders. Defaults to "quoteCoin"
+            order_link_id (str, optional): Client order ID; the exchange rejects a
+                second order with the same ID
 
         Returns:
             dict: Order placement result
@@ -317,42 +484,7 @@ class BybitHelper:
             raise ValueError('Invalid order side. Use "Buy" or "Sell"')
 
         try:
-            # Get minimum order quantity
-            api_result = self.client.get_instruments_info(
-                category=category, symbol=symbol
-            )
-            
-            # Handle different response formats from the API
-            if isinstance(api_result, tuple):
-                if len(api_result) == 3:
-                    instrument_info, _, _ = api_result
-                elif len(api_result) == 2:
-                    instrument_info, _ = api_result
-                else:
-                    instrument_info = api_result[0]
-            else:
-                instrument_info = api_result
-            lot_size_filter = (
-                instrument_info.get("result", {})
-                .get("list", [])[0]
-                .get("lotSizeFilter", {})
-            )
-            min_order_qty = float(lot_size_filter.get("minOrderQty", "0.0"))
-            min_order_amt = float(lot_size_filter.get("minOrderAmt", "0.0"))
-
-            # Check minimum order quantity based on market unit
-            if market_unit == "quoteCoin":
-                # When buying for USDT amount, check minimum order amount
-                if min_order_amt > 0 and qty < min_order_amt:
-                    raise ValueError(
-                        f"Order amount {qty} USDT is less than minimum allowed {min_order_amt} USDT"
-                    )
-            else:
-                # When buying specific coin quantity, check minimum order quantity
-                if min_order_qty > 0 and qty < min_order_qty:
-                    raise ValueError(
-                        f"Quantity {qty} is less than minimum allowed {min_order_qty}"
-                    )
+            self._validate_order_size(category, symbol, qty, market_unit)
 
             api_result = self.client.place_order(
                 category=category,
@@ -361,32 +493,268 @@ class BybitHelper:
                 orderType=order_type,
                 qty=qty,
                 marketUnit=market_unit,
+                **({"orderLinkId": order_link_id} if order_link_id else {}),
             )
             
-            # Handle different response formats from the API
-            if isinstance(api_result, tuple):
-                if len(api_result) == 3:
-                    response, _, headers = api_result
-                elif len(api_result) == 2:
-                    response, _ = api_result
-                    headers = None
-                else:
-                    response = api_result[0]
-                    headers = None
-            else:
-                response = api_result
-                headers = None
+            response, headers = _unpack(api_result)
 
             # self.log_limits(headers)
+            self._balances = None  # balances change once the order fills
+            self._check_instrument_mismatch(category, symbol, response)
             return response
 
         except Exception as e:
             raise RuntimeError(f"Order placement failed: {str(e)}")
 
+    def get_lot_filter(self, category: str, symbol: str) -> tuple:
+        """
+        Get parsed lot size limits for a symbol
+
+        Limits are kept in memory for LOT_FILTER_TTL seconds, so repeated
+        orders skip the instrument lookup and parsing.
+
+        Args:
+            category (str): Market category (e.g. "linear", "spot")
+            symbol (str): Trading pair symbol (e.g. "BTCUSDT")
+
+        Returns:
+            tuple: (min_order_qty, min_order_amt)
+        """
+        key = (category, symbol)
+        now = time.monotonic()
+        cached = self._lot_filters.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        instrument_info = self.get_instrument_info(category, symbol)
+        lot_size_filter = (
+            _unwrap(instrument_info, "Instrument information retrieval")[0]
+            .get("lotSizeFilter", {})
+        )
+        limits = (
+            float(lot_size_filter.get("minOrderQty", "0.0")),
+            float(lot_size_filter.get("minOrderAmt", "0.0")),
+        )
+        self._lot_filters[key] = (now + LOT_FILTER_TTL, limits)
+        return limits
+
+    def get_quantity_decimals(self, category: str, symbol: str) -> int:
+        """
+        Get number of decimal places allowed in order quantity
+
+        Args:
+            category (str): Market category (e.g. "linear", "spot")
+            symbol (str): Trading pair symbol (e.g. "BTCUSDT")
+
+        Returns:
+            int: Decimal places of the instrument's basePrecision (e.g. 2 for "0.01")
+
+        Raises:
+            RuntimeError: If instrument information retrieval fails
+            ValueError: If the instrument has no base precision
+        """
+        key = (category, symbol)
+        decimals = self._quantity_decimals.get(key)
+        if decimals is None:
+            instrument_info = self.get_instrument_info(category, symbol)
+            lot_size_filter = (
+                _unwrap(instrument_info, "Instrument information retrieval")[0]
+                .get("lotSizeFilter", {})
+            )
+            base_precision = lot_size_filter.get("basePrecision")
+            if not base_precision:
+                raise ValueError(f"No base precision for {symbol}")
+            decimals = max(0, -Decimal(base_precision).normalize().as_tuple().exponent)
+            self._quantity_decimals[key] = decimals
+        return decimals
+
+    def _validate_order_size(
+        self, category: str, symbol: str, qty: float, market_unit: str
+    ):
+        """
+        Check order quantity against instrument lot size limits
+
+        Args:
+            category (str): Market category (e.g. "linear", "spot")
+            symbol (str): Trading pair symbol (e.g. "BTCUSDT")
+            qty (float): Order quantity
+            market_unit (str): Unit for market orders ("quoteCoin" or "baseCoin")
+
+        Raises:
+            ValueError: If quantity is below the instrument minimum
+        """
+        # Get minimum order quantity
+        min_order_qty, min_order_amt = self.get_lot_filter(category, symbol)
+
+        # Check minimum order quantity based on market unit
+        if market_unit == "quoteCoin":
+            # When buying for USDT amount, check minimum order amount
+            if min_order_amt > 0 and qty < min_order_amt:
+                raise ValueError(
+                    f"Order amount {qty} USDT is less than minimum allowed {min_order_amt} USDT"
+                )
+        else:
+            # When buying specific coin quantity, check minimum order quantity
+            if min_order_qty > 0 and qty < min_order_qty:
+                raise ValueError(
+                    f"Quantity {qty} is less than minimum allowed {min_order_qty}"
+                )
+
+    def prepare_order_draft(
+        self,
+        category: str,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: float,
+        market_unit: str = "quoteCoin",
+    ) -> dict:
+        """
+        Prepare a signed-on-send order ahead of time
+
+        Validates the order, serializes the request body and precomputes
+        the HMAC key state, so that send_order_draft only has to append the
+        client order ID and stamp the timestamp and signature when the
+        strategy decides to trade. The draft can be sent more than once,
+        each time as a new order.
+
+        Args:
+            category (str): Market category (e.g. "linear", "spot")
+            symbol (str): Trading pair symbol (e.g. "BTCUSDT")
+            side (str): Order side ("Buy" or "Sell")
+            order_type (str): Order type (e.g. "Market", "Limit")
+            qty (float): Order quantity
+            market_unit (str, optional): Unit for market orders. Defaults to "quoteCoin"
+
+        Returns:
+            dict: Order draft to pass to send_order_draft
+
+        Raises:
+            ValueError: If client is not initialized or order parameters are invalid
+            RuntimeError: If order validation fails
+        """
+        if not self.client:
+            raise ValueError("HTTP client not initialized")
+        if not all([category, symbol, side, order_type]):
+            raise ValueError("Order parameters not specified")
+        if qty <= 0:
+            raise ValueError("Quantity must be greater than 0")
+        if side not in ["Buy", "Sell"]:
+            raise ValueError('Invalid order side. Use "Buy" or "Sell"')
+        if not self.client.api_key or not self.client.api_secret:
+            raise ValueError("API key and secret are required for placing orders")
+
+        try:
+            self._validate_order_size(category, symbol, qty, market_unit)
+        except Exception as e:
+            raise RuntimeError(f"Order draft preparation failed: {str(e)}")
+
+        params = {
+            "category": category,
+            "symbol": symbol,
+            "side": side,
+            "orderType": order_type,
+            "qty": str(qty),
+            "marketUnit": market_unit,
+        }
+        body = orjson.dumps(params) if orjson else json.dumps(params).encode("utf-8")
+        # Body without the closing brace; orderLinkId is appended per send
+        body_head = body[:-1]
+        recv_window = str(self.client.recv_window)
+        # Signature payload is timestamp + api_key + recv_window + body;
+        # everything between the timestamp and orderLinkId is fixed for the draft
+        payload_head = (self.client.api_key + recv_window).encode("utf-8") + body_head
+        key_state = hmac.new(
+            self.client.api_secret.encode("utf-8"), digestmod=hashlib.sha256
+        )
+
+        def sign(timestamp: str, body_tail: bytes) -> str:
+            h = key_state.copy()
+            h.update(timestamp.encode("utf-8"))
+            h.update(payload_head)
+            h.update(body_tail)
+            return h.hexdigest()
+
+        return {
+            "url": f"{self.client.endpoint}/v5/order/create",
+            "body_head": body_head,
+            "headers": {
+                "Content-Type": "application/json",
+                "X-BAPI-API-KEY": self.client.api_key,
+                "X-BAPI-SIGN-TYPE": "2",
+                "X-BAPI-RECV-WINDOW": recv_window,
+            },
+            "sign": sign,
+            "category": category,
+            "symbol": symbol,
+            "side": side,
+            "qty": qty,
+        }
+
+    def send_order_draft(self, draft: dict, order_link_id: str) -> dict:
+        """
+        Send an order prepared by prepare_order_draft
+
+        The request bypasses pybit, so a rejection is raised the way pybit
+        raises it: as InvalidRequestError carrying the retCode.
+
+        Args:
+            draft (dict): Order draft
+            order_link_id (str): Client order ID; the exchange rejects a second
+                order with the same ID, so a resend can't place the order twice
+
+        Returns:
+            dict: Order placement result
+
+        Raises:
+            ValueError: If client is not initialized
+            RuntimeError: If order placement fails, raised from InvalidRequestError
+                if the exchange rejected the order
+        """
+        if not self.client:
+            raise ValueError("HTTP client not initialized")
+
+        if isinstance(self.client, PooledHTTP):
+            self.client.throttle(draft["url"])
+
+        body_tail = f',"orderLinkId":"{order_link_id}"}}'.encode("utf-8")
+        timestamp = str(int(time.time() * 1000))
+        headers = dict(draft["headers"])
+        headers["X-BAPI-TIMESTAMP"] = timestamp
+        headers["X-BAPI-SIGN"] = draft["sign"](timestamp, body_tail)
+
+        try:
+            response = self.client.client.post(
+                draft["url"],
+                data=draft["body_head"] + body_tail,
+                headers=headers,
+                timeout=self.client.timeout,
+            )
+            response.raise_for_status()
+            result = response.json()
+        except Exception as e:
+            raise RuntimeError(f"Order placement failed: {str(e)}")
+
+        self._balances = None  # balances change once the order fills
+        self._check_instrument_mismatch(draft["category"], draft["symbol"], result)
+        if result.get("retCode") != 0:
+            error = InvalidRequestError(
+                request=f"POST {draft['url']}: {draft['symbol']} {draft['side']} {draft['qty']}",
+                message=result.get("retMsg"),
+                status_code=result.get("retCode"),
+                time=time.strftime("%H:%M:%S", time.gmtime()),
+                resp_headers=response.headers,
+            )
+            raise RuntimeError(f"Order placement failed: {str(error)}") from error
+        return result
+
     def get_instrument_info(self, category: str, symbol: str) -> dict:
         """
         Get instrument information
 
+        Instrument specs are effectively static, so successful responses are
+        cached for a day in memory and on disk.
+
         Args:
             category (str): Market category (e.g. "spot", "linear")
             symbol (str): Trading pair symbol (e.g. "BTCUSDT")
@@ -401,30 +769,26 @@ class BybitHelper:
         if not self.client:
             raise ValueError("HTTP client not initialized")
 
+        params = {"category": category, "symbol": symbol}
+        cached = self.cache.get("instruments_info", params)
+        if cached is not None:
+            return cached
+
         try:
             api_result = self.client.get_instruments_info(
                 category=category,
                 symbol=symbol
             )
             
-            # Handle different response formats from the API
-            if isinstance(api_result, tuple):
-                if len(api_result) == 3:
-                    response, _, headers = api_result
-                elif len(api_result) == 2:
-                    response, _ = api_result
-                    headers = None
-                else:
-                    response = api_result[0]
-                    headers = None
-            else:
-                response = api_result
-                headers = None
+            response, headers = _unpack(api_result)
             # self.log_limits(headers)
-            return response
         except Exception as e:
             raise RuntimeError(f"Instrument information retrieval failed: {str(e)}")
 
+        if response.get("retCode") == 0 and response.get("result", {}).get("list"):
+            self.cache.set("instruments_info", params, response)
+        return response
+
     def get_price(self, category: str, symbol: str) -> float:
         """
         Get current price for a symbol
@@ -441,22 +805,76 @@ class BybitHelper:
 
         api_result = self.client.get_tickers(category=category, symbol=symbol)
         
-        # Handle different response formats from the API
-        if isinstance(api_result, tuple):
-            if len(api_result) == 3:
-                r, _, h = api_result
-            elif len(api_result) == 2:
-                r, _ = api_result
-                h = None
-            else:
-                r = api_result[0]
-                h = None
-        else:
-            r = api_result
-            h = None
+        r, h = _unpack(api_result)
         # self.log_limits(h)
 
-        return float(r.get("result", {}).get("list", [{}])[0].get("lastPrice", "0"))
+        return float(_unwrap(r, "Price retrieval")[0]["lastPrice"])
+
+    def fetch_all_tickers(self, category: str = "spot") -> dict:
+        """
+        Get tickers for all symbols in a category with a single request
+
+        Args:
+            category: Market category (spot, linear, inverse)
+
+        Returns:
+            dict: Ticker data keyed by symbol (e.g. {"BTCUSDT": {"lastPrice": ...}})
+        """
+        if not self.client:
+            raise ValueError("HTTP client not initialized")
+
+        api_result = self.client.get_tickers(category=category)
+
+        r, h = _unpack(api_result)
+        # self.log_limits(h)
+
+        return {
+            ticker["symbol"]: ticker
+            for ticker in _unwrap(r, "Tickers retrieval")
+            if ticker.get("symbol")
+        }
+
+    def get_klines(
+        self, category: str, symbol: str, interval: str = "1", limit: int = 200
+    ) -> list:
+        """
+        Get candles for a symbol
+
+        Args:
+            category: Market category (spot, linear, inverse)
+            symbol: Trading pair symbol (e.g. BTCUSDT)
+            interval: Candle interval in minutes ("1", "60", ...) or "D", "W", "M"
+            limit: Number of candles to get (max 1000)
+
+        Non-empty results are cached briefly, see cache.DEFAULT_TTL.
+
+        Returns:
+            list: Candles [startTime, open, high, low, close, volume, turnover], newest first
+        """
+        if not self.client:
+            raise ValueError("HTTP client not initialized")
+
+        params = {"category": category, "symbol": symbol, "interval": interval, "limit": limit}
+        return self.cache.get_or_fetch(
+            "kline", params, lambda: self._fetch_klines(params), is_valid=bool
+        )
+
+    def _fetch_klines(self, params: dict) -> list:
+        """
+        Request candles from the API
+
+        Args:
+            params: get_kline request parameters
+
+        Returns:
+            list: Candles, newest first
+        """
+        api_result = self.client.get_kline(**params)
+
+        r, h = _unpack(api_result)
+        # self.log_limits(h)
+
+        return _unwrap(r, "Klines retrieval")
 
     def get_price_change(self, category: str, symbol: str, hours: int = 1) -> float:
         """
@@ -473,52 +891,39 @@ class BybitHelper:
         if not self.client:
             raise ValueError("HTTP client not initialized")
 
-        # Get current price
-        current_price = self.get_price(category, symbol)
-
-        # Get klines data
-        interval = "60"  # 1 hour intervals
-        limit = hours  # Number of candles to get
-        api_result = self.client.get_kline(
-            category=category,
-            symbol=symbol,
-            interval=interval,
-            limit=limit,
+        # One kline request gives both prices: candles are newest first, so the
+        # newest close is the current price and the oldest open is the price
+        # from hours ago. The cache is bypassed to keep the close live.
+        candles = self._fetch_klines(
+            {"category": category, "symbol": symbol, "interval": "60", "limit": hours}
         )
-        
-        # Handle different response formats from the API
-        if isinstance(api_result, tuple):
-            if len(api_result) == 3:
-                r, _, h = api_result
-            elif len(api_result) == 2:
-                r, _ = api_result
-                h = None
-            else:
-                r = api_result[0]
-                h = None
-        else:
-            r = api_result
-            h = None
-        # self.log_limits(h)
+        if not candles:
+            return 0
 
-        # Get price from hours ago
-        old_price = float(r.get("result", {}).get("list", [[0]])[0][1])  # Open price
+        prices = _kline_array(candles)
+        current_price = float(prices[0, KLINE_CLOSE])
+        old_price = float(prices[-1, KLINE_OPEN])
 
         # Calculate percentage change
         if old_price == 0:
             return 0
         return ((current_price - old_price) / old_price) * 100
 
-    def round_down(self, value: float, decimals: int) -> float:
+    @staticmethod
+    def round_down(value: float, decimals: int) -> float:
         """
         Remove excess from float
 
+        Uses float scaling by a precomputed power of ten (no Decimal), so it is
+        cheap enough for the sell path. Unlike a bare floor of the scaled value,
+        values that already have at most `decimals` places (e.g. 0.29) are
+        returned unchanged; everything else is truncated, never rounded up.
+
         Args:
             value (float): Number to process
-            decimals (int): Number of decimal places
+            decimals (int): Number of decimal places (0-18)
 
         Returns:
             float: Processed number
         """
-        multiplier = 10**decimals
-        return float(int(value * multiplier)) / multiplier
+        return _truncate(value, POW10[decimals])
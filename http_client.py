@@ -0,0 +1,222 @@
+"""
+HTTP client for Bybit API
+
+This module provides a pybit HTTP client whose underlying
+requests session keeps connections alive and reuses them
+across calls, so polling loops don't pay a TCP+TLS handshake
+on every request. Responses are decoded with orjson, or ujson,
+when one of them is installed.
+"""
+
+import functools
+import hashlib
+import hmac
+import json
+import socket
+import threading
+import time
+
+import requests
+from pybit.unified_trading import HTTP
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional dependency, falls back to ujson or stdlib json
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # optional dependency, falls back to stdlib json
+    ujson = None
+
+
+def _ujson_loads(content: bytes):
+    try:
+        return ujson.loads(content)
+    except ValueError as e:
+        # pybit retries on the stdlib error type, which ujson doesn't subclass
+        raise json.JSONDecodeError(str(e), content.decode("utf-8", "replace"), 0) from e
+
+
+# Fast decoder for response bodies, None to use requests' own json()
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError,
+    # so callers catching the stdlib error keep working
+    fast_loads = orjson.loads
+elif ujson is not None:
+    fast_loads = _ujson_loads
+else:
+    fast_loads = None
+
+
+RECV_WINDOW = 60000  # request validity window in milliseconds
+RATE_LIMIT = 20  # requests per second allowed per endpoint, below Bybit's per-UID limits
+POOL_CONNECTIONS = 20  # number of host pools to cache
+POOL_MAXSIZE = 100  # max connections kept alive per host
+# Transient statuses retried for idempotent requests (urllib3 never retries POST on status)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),  # send small order requests immediately
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),  # detect dead idle connections in the pool
+]
+
+
+class FastJSONResponse(requests.Response):
+    """
+    Response that decodes JSON bodies with orjson or ujson
+    """
+
+    def json(self, **kwargs):
+        if kwargs:
+            return super().json(**kwargs)
+        return fast_loads(self.content)
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTP adapter with a large connection pool and tuned socket options
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        if fast_loads is not None:
+            response.__class__ = FastJSONResponse
+        return response
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting request rate
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        Initialize bucket
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float, optional): Maximum burst size. Defaults to rate
+        """
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take one token, sleeping until it is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve the token even if the bucket is empty, so concurrent
+            # callers queue up behind each other instead of all retrying
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def configure_session(session: requests.Session):
+    """
+    Mount the keep-alive connection pool on a requests session
+
+    Args:
+        session: requests session used by a pybit HTTP client
+    """
+    if isinstance(session.get_adapter("https://"), KeepAliveAdapter):
+        return
+
+    adapter = KeepAliveAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=RETRY_STATUSES,
+            # Hand the last response to pybit's own error handling
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+
+
+class PooledHTTP(HTTP):
+    """
+    pybit HTTP client with a persistent keep-alive connection pool
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        configure_session(self.client)
+        self._rate_limiters = {}
+
+        # HMAC state with the secret key already absorbed; copied for each signature
+        self._hmac_template = (
+            hmac.new(self.api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+            if self.api_secret and not getattr(self, "rsa_authentication", False)
+            else None
+        )
+
+    def throttle(self, path: str):
+        """
+        Wait until a request to the endpoint fits in its rate limit
+
+        Args:
+            path: Request URL
+        """
+        bucket = self._rate_limiters.get(path)
+        if bucket is None:
+            bucket = self._rate_limiters.setdefault(path, TokenBucket(RATE_LIMIT))
+        bucket.acquire()
+
+    def _submit_request(self, method=None, path=None, query=None, auth=False):
+        # Concurrent callers share the client, so limit the rate here
+        self.throttle(path)
+        return super()._submit_request(method=method, path=path, query=query, auth=auth)
+
+    def _auth(self, payload, recv_window, timestamp):
+        """
+        Sign a request with the precomputed HMAC key state
+        """
+        if self._hmac_template is None or self.api_key is None:
+            return super()._auth(payload, recv_window, timestamp)
+
+        param_str = str(timestamp) + self.api_key + str(recv_window) + payload
+        h = self._hmac_template.copy()
+        h.update(param_str.encode("utf-8"))
+        return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def get_client(api_key: str | None = None, api_secret: str | None = None) -> PooledHTTP:
+    """
+    Get a shared pooled HTTP client
+
+    The client is created on first use and reused for the same credentials,
+    so every caller in the process shares one connection pool.
+
+    Args:
+        api_key: Bybit API key, or None for public endpoints only
+        api_secret: Bybit API secret, or None for public endpoints only
+
+    Returns:
+        PooledHTTP: Shared HTTP client
+    """
+    return PooledHTTP(
+        api_key=api_key,
+        api_secret=api_secret,
+        recv_window=RECV_WINDOW,
+        return_response_headers=True,
+    )
@@ -2,22 +2,62 @@
 Bot operations logging module
 
 Provides functionality for logging both to console
-and to file with timestamps.
+and to file with timestamps. Records are written
+by a background thread.
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_MAX_BYTES = 10 * 1024 * 1024  # rotate log file at 10 MB
+LOG_BACKUP_COUNT = 5  # rotated files to keep
+LOG_BUFFER_CAPACITY = 100  # records written to file in one batch
+
+# (queue handler on the root logger, listener) from the last setup_logger call
+_active_setup = None
+
+
+def _teardown_logger():
+    """
+    Detach and flush handlers installed by a previous setup_logger call
+    """
+    global _active_setup
+    if _active_setup is None:
+        return
+
+    queue_handler, listener = _active_setup
+    _active_setup = None
+    logging.getLogger().removeHandler(queue_handler)
+    atexit.unregister(listener.stop)
+    listener.stop()
+    for handler in listener.handlers:
+        # MemoryHandler.close() flushes and drops its target without closing it
+        target = handler.target if isinstance(handler, MemoryHandler) else None
+        handler.close()
+        if target is not None:
+            target.close()
 
 
 def setup_logger(coin: str, buy_amount: float):
     """
     Sets up logger for writing to file and console output
 
+    The level is INFO unless overridden with the LOG_LEVEL environment
+    variable (e.g. LOG_LEVEL=DEBUG to see per-tick strategy messages).
+    Calling it again replaces the previous handlers instead of adding
+    to them, so records are never written twice.
+
     Args:
         coin: Cryptocurrency name
         buy_amount: Amount to buy
     """
+    global _active_setup
+    _teardown_logger()
+
     # Create logs directory if it doesn't exist
     if not os.path.exists('logs'):
         os.makedirs('logs')
@@ -26,25 +66,45 @@ def setup_logger(coin: str, buy_amount: float):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_filename = f"logs/bot_{coin}_{buy_amount}_{timestamp}.log"
 
-    # Configure logging format
+    # Configure logging format; records about a trading pair carry it
+    # in extra={"symbol": ...} so it is a separate field, not message text
     formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        '%(asctime)s | %(levelname)s | %(symbol)s | %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        defaults={"symbol": "-"},
     )
 
-    # Create file handler
-    file_handler = logging.FileHandler(log_filename)
+    # Create file handler, batching records and flushing at once on warnings
+    file_handler = RotatingFileHandler(
+        log_filename, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+    )
     file_handler.setFormatter(formatter)
+    buffered_file_handler = MemoryHandler(
+        LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+    )
 
     # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
 
+    # Write records on a background thread so file and console I/O
+    # don't block the trading loop
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, buffered_file_handler, console_handler)
+    listener.start()
+    # Drain queued records on exit; logging's own shutdown hook, registered
+    # earlier and so run later, then flushes the buffered file handler
+    atexit.register(listener.stop)
+
     # Configure root logger
+    level = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+    if not isinstance(level, int):
+        level = logging.INFO  # unknown level name
     logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    logger.setLevel(level)
+    queue_handler = QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    _active_setup = (queue_handler, listener)
 
     # Log startup
     logging.info(f"Starting bot for {coin} with buy amount {buy_amount} USDT")
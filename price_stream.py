@@ -0,0 +1,152 @@
+"""
+Live prices from Bybit WebSocket ticker stream
+
+This module keeps the last traded price of subscribed symbols in
+memory, updated on every ticker push, so strategies can read prices
+without a REST round-trip and react to a price crossing a level as
+soon as the tick arrives.
+"""
+
+import logging
+import threading
+import time
+
+from pybit.unified_trading import WebSocket
+
+# Prices older than this (in seconds) are treated as missing, e.g. while reconnecting
+STREAM_MAX_AGE = 60
+
+
+class PriceStream:
+    """
+    Last prices of symbols pushed by the public ticker stream
+    """
+
+    def __init__(self, category: str, symbols: list, testnet: bool = False):
+        """
+        Initialize stream
+
+        Args:
+            category (str): Market category (e.g. "spot")
+            symbols (list): Trading pair symbols (e.g. ["BTCUSDT", "ETHUSDT"])
+            testnet (bool, optional): Connect to testnet. Defaults to False
+        """
+        self.category = category
+        self.symbols = list(symbols)
+        self.testnet = testnet
+        self._prices = {}  # symbol -> (monotonic receive time, last price)
+        self._updated = threading.Condition()
+        self._ws = None
+
+    def start(self) -> bool:
+        """
+        Connect and subscribe to tickers of all symbols
+
+        Returns:
+            bool: True if subscribed, False if prices have to be polled over REST
+        """
+        try:
+            self._ws = WebSocket(testnet=self.testnet, channel_type=self.category)
+            self._ws.ticker_stream(symbol=self.symbols, callback=self._on_tick)
+            return True
+        except Exception as e:
+            logging.warning(f"Could not subscribe to ticker stream, polling prices instead: {str(e)}")
+            self.stop()
+            return False
+
+    def add_symbol(self, symbol: str):
+        """
+        Subscribe to one more symbol on the open connection
+
+        Args:
+            symbol (str): Trading pair symbol (e.g. "BTCUSDT")
+        """
+        if symbol in self.symbols:
+            return
+        self.symbols.append(symbol)
+        if self._ws is None:
+            return
+        try:
+            self._ws.ticker_stream(symbol=symbol, callback=self._on_tick)
+        except Exception as e:
+            logging.warning(f"Could not subscribe to {symbol} ticker, polling its price instead: {str(e)}")
+
+    def stop(self):
+        """
+        Close the connection
+        """
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            try:
+                ws.exit()
+            except Exception as e:
+                logging.debug(f"Error closing ticker stream: {str(e)}")
+
+    def wake(self):
+        """
+        Wake threads blocked in wait_for_cross so they recheck their stop event
+        """
+        with self._updated:
+            self._updated.notify_all()
+
+    def _on_tick(self, message: dict):
+        data = message.get("data") or {}
+        try:
+            price = float(data["lastPrice"])
+        except (KeyError, TypeError, ValueError):
+            return
+        with self._updated:
+            self._prices[data.get("symbol")] = (time.monotonic(), price)
+            self._updated.notify_all()
+
+    def get(self, symbol: str, max_age: float = STREAM_MAX_AGE) -> float | None:
+        """
+        Get last streamed price
+
+        Args:
+            symbol (str): Trading pair symbol (e.g. "BTCUSDT")
+            max_age (float, optional): Maximum price age in seconds. Defaults to STREAM_MAX_AGE
+
+        Returns:
+            float: Last price, or None if there is no recent price
+        """
+        entry = self._prices.get(symbol)
+        if entry is None or time.monotonic() - entry[0] > max_age:
+            return None
+        return entry[1]
+
+    def wait_for_cross(
+        self,
+        symbol: str,
+        deadline: float,
+        low: float | None = None,
+        high: float | None = None,
+        stop_event: threading.Event | None = None,
+    ) -> bool:
+        """
+        Block until the streamed price leaves the (low, high) range or the deadline passes
+
+        Without a connection this simply sleeps until the deadline.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g. "BTCUSDT")
+            deadline (float): Monotonic time to give up at
+            low (float, optional): Return once price is at or below this level
+            high (float, optional): Return once price is at or above this level
+            stop_event (threading.Event, optional): Return once this is set; call
+                wake() after setting it
+
+        Returns:
+            bool: True if the price crossed a level or stop_event is set, False on timeout
+        """
+
+        def crossed() -> bool:
+            if stop_event is not None and stop_event.is_set():
+                return True
+            price = self.get(symbol)
+            return price is not None and (
+                (low is not None and price <= low) or (high is not None and price >= high)
+            )
+
+        with self._updated:
+            return self._updated.wait_for(crossed, timeout=max(0.0, deadline - time.monotonic()))
@@ -0,0 +1,71 @@
+"""
+Strategy state persistence
+
+This module saves the open position of a running strategy to a small
+JSON file, so a restarted bot picks up the position it holds instead
+of forgetting it and buying again.
+"""
+
+import json
+import logging
+import os
+
+STATE_DIR = "state"
+
+
+def _path(name: str) -> str:
+    return os.path.join(STATE_DIR, f"{name}.json")
+
+
+def load_state(name: str) -> dict | None:
+    """
+    Load saved state
+
+    Args:
+        name (str): State name (e.g. "XRPUSDT")
+
+    Returns:
+        dict: Saved state, or None if there is none
+    """
+    try:
+        with open(_path(name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logging.warning(f"Could not load state {name}: {str(e)}")
+        return None
+
+
+def save_state(name: str, state: dict):
+    """
+    Save state atomically, replacing the previous one
+
+    Args:
+        name (str): State name (e.g. "XRPUSDT")
+        state (dict): JSON serializable state
+    """
+    try:
+        os.makedirs(STATE_DIR, exist_ok=True)
+        path = _path(name)
+        tmp_file = f"{path}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_file, path)
+    except OSError as e:
+        logging.warning(f"Could not save state {name}: {str(e)}")
+
+
+def clear_state(name: str):
+    """
+    Remove saved state
+
+    Args:
+        name (str): State name (e.g. "XRPUSDT")
+    """
+    try:
+        os.remove(_path(name))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.warning(f"Could not remove state {name}: {str(e)}")
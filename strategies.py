@@ -7,10 +7,112 @@ that can be used with the Bybit API.
 
 import logging
 import random
+import threading
 import time
-from datetime import datetime
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import requests
+from pybit import exceptions
+
+try:
+    from numba import njit
+except ImportError:  # optional dependency, falls back to pure Python
+    njit = None
+
+from helpers import KLINE_OPEN, KLINE_START, BybitHelper
+from price_stream import PriceStream
+from state import clear_state, load_state, save_state
+
+# Bybit error codes for invalid API key, signature, permissions or failed authentication
+AUTH_ERROR_CODES = {10003, 10004, 10005, 10007}
+# Bybit error codes for exceeded request rate limits
+RATE_LIMIT_CODES = {10006, 10018}
+# Client HTTP errors that may succeed when retried later
+# (403 is Bybit's IP rate limit, 418/429 generic throttling)
+RETRYABLE_HTTP_STATUSES = {403, 418, 429}
+# Upper bound for a single retry wait in seconds
+MAX_RETRY_DELAY = 60
+# Base wait in seconds before a strategy restarts after too many errors
+RESTART_DELAY = 30
+# Successful iterations in a row after which restart backoff starts over
+RESTART_RESET_ITERATIONS = 60
+# Seconds an open position may leave the REST connection idle before it is
+# refreshed, so the sell order doesn't wait for a new TCP+TLS handshake
+CONNECTION_KEEPALIVE_INTERVAL = 30
+# Share of the minimum profit a position may lag behind it before it is
+# polled less often (nothing can trigger until it recovers)
+UNDERWATER_GAP_RATIO = 0.5
+# Attempts to send one order; resends only after the order history shows
+# the previous attempt wasn't placed
+ORDER_SEND_ATTEMPTS = 3
+# Polls of the order history until a market order reaches a final status
+FILL_POLL_ATTEMPTS = 10
+FILL_POLL_INTERVAL = 0.2
+# Share of a market buy assumed lost to fee and slippage when neither
+# the fill nor the wallet balance can be read (spot taker fee is 0.1%)
+FALLBACK_FEE_RATE = 0.002
+# Order statuses after which cumExecQty no longer changes
+FINAL_ORDER_STATUSES = {"Filled", "PartiallyFilledCanceled", "Cancelled", "Rejected", "Deactivated"}
+# Quantity decimal places used when instrument precision can't be read;
+# the one table to edit for coins missing here (lookup in get_quantity_decimals)
+QUANTITY_DECIMALS = {
+    "BTC": 6,  # High-value coins need more precision
+    "ETH": 6,
+    "XRP": 1,  # Low-value coins typically use 1 decimal
+    "ADA": 1,
+    "DOGE": 1,
+    "TRX": 1,
+}
+DEFAULT_QUANTITY_DECIMALS = 2  # Default for most coins
+# Actions returned by trailing_step
+TRAILING_HOLD = 0
+TRAILING_UPDATE = 1
+TRAILING_SELL = 2
+
+# Shared pool for overlapping independent REST calls (network I/O releases the GIL).
+# Its size also bounds the number of in-flight requests during whitelist scans.
+_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="bybit-io")
+
+# Set to make running strategies return; their waits end early instead of sleeping on
+_stop_event = threading.Event()
+
+# Streams of running strategies, woken on stop so waits for a price cross end at once
+_active_streams = set()
+
+# (category, symbol, hours) -> (monotonic expiry time, price change)
+_price_change_cache = {}
+
+
+def stop_strategies():
+    """
+    Ask running strategies to stop after their current iteration
+
+    Open positions stay saved and are resumed on the next start.
+    """
+    _stop_event.set()
+    for stream in list(_active_streams):
+        stream.wake()
+
+
+def run_parallel(*callables) -> list:
+    """
+    Run independent API calls concurrently on the shared I/O pool
+
+    Args:
+        *callables: functions without arguments, e.g. bound methods or lambdas
+
+    Returns:
+        list: results in the same order as the callables
 
-from helpers import BybitHelper
+    Raises:
+        Exception: the first exception raised by any of the callables
+    """
+    futures = [_executor.submit(func) for func in callables]
+    return [future.result() for future in futures]
 
 
 def format_price(price: float | None) -> str:
@@ -25,19 +127,38 @@ def format_price(price: float | None) -> str:
     """
     if price is None or price == 0:
         return "0.0000"
-    
+
+    # Common case first
+    if price >= 0.0001:
+        return f"{price:.4f}"
+
     # For very small prices, show up to 12 decimal places
-    if price < 0.0001:
-        formatted = f"{price:.12f}".rstrip('0').rstrip('.')
-        # Ensure at least 4 decimal places for consistency
-        if '.' in formatted and len(formatted.split('.')[1]) < 4:
-            return f"{price:.4f}"
-        return formatted
-    else:
+    formatted = f"{price:.12f}".rstrip('0').rstrip('.')
+    # Ensure at least 4 decimal places for consistency
+    if '.' in formatted and len(formatted.split('.')[1]) < 4:
         return f"{price:.4f}"
+    return formatted
 
 
-def check_minimum_order_size(helper: BybitHelper, symbol: str, buy_amount: float) -> bool:
+class LazyPrice:
+    """
+    Price formatted with format_price only when a log record is emitted
+
+    Pass as a %s argument to logging calls, so disabled levels skip the formatting.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: float | None):
+        self.value = value
+
+    def __str__(self) -> str:
+        return format_price(self.value)
+
+
+def check_minimum_order_size(
+    helper: BybitHelper, symbol: str, buy_amount: float, current_price: float | None = None
+) -> bool:
     """
     Check if the order meets minimum size requirements
     
@@ -45,31 +166,22 @@ def check_minimum_order_size(helper: BybitHelper, symbol: str, buy_amount: float
         helper: BybitHelper instance
         symbol: trading symbol (e.g., "WENUSDT")
         buy_amount: amount in USDT to buy
+        current_price: price already known to the caller, fetched if omitted
         
     Returns:
         True if order size is valid, False otherwise
     """
     try:
-        # Get instrument info to check minimum order requirements
-        instruments_info = helper.get_instrument_info(
-            category="spot",
-            symbol=symbol
-        )
-        
-        if instruments_info["retCode"] != 0:
-            logging.error(f"Failed to get instrument info for {symbol}: {instruments_info['retMsg']}")
-            return False
-            
-        if not instruments_info["result"]["list"]:
-            logging.error(f"No instrument info found for {symbol}")
-            return False
-            
-        instrument = instruments_info["result"]["list"][0]
-        min_order_amt = float(instrument.get("lotSizeFilter", {}).get("minOrderAmt", "0"))
-        min_order_qty = float(instrument.get("lotSizeFilter", {}).get("minOrderQty", "0"))
+        # Lot size limits are kept by the helper for an hour and dropped
+        # when an order is rejected because of outdated instrument rules
+        if current_price is None:
+            (min_order_qty, min_order_amt), current_price = run_parallel(
+                lambda: helper.get_lot_filter("spot", symbol),
+                lambda: helper.get_price("spot", symbol),
+            )
+        else:
+            min_order_qty, min_order_amt = helper.get_lot_filter("spot", symbol)
         
-        # Get current price to calculate minimum USDT required
-        current_price = helper.get_price("spot", symbol)
         min_usdt_required = min_order_qty * current_price
         
         logging.info(f"Order validation for {symbol}:")
@@ -97,40 +209,278 @@ def check_minimum_order_size(helper: BybitHelper, symbol: str, buy_amount: float
         return False
 
 
+class PriceWindow:
+    """
+    Sliding window of recent prices for computing price change locally
+
+    Keeps (timestamp, price) samples covering the last `hours` plus one
+    sample at or before the window start, which is the reference price.
+    """
+
+    def __init__(self, hours: float):
+        """
+        Args:
+            hours: window length in hours
+        """
+        self.seconds = hours * 3600
+        self.samples = deque()
+
+    def add(self, timestamp: float, price: float):
+        """
+        Add a price sample and drop samples that fell out of the window
+
+        Args:
+            timestamp: sample time in seconds since epoch
+            price: price value
+        """
+        if price <= 0:
+            return
+        self.samples.append((timestamp, price))
+        cutoff = timestamp - self.seconds
+        while len(self.samples) > 1 and self.samples[1][0] <= cutoff:
+            self.samples.popleft()
+
+    def warm_up(self, candles: list):
+        """
+        Fill the window from candles
+
+        Args:
+            candles: Bybit candles [startTime, open, ...], newest first
+        """
+        for candle in reversed(candles):
+            self.add(int(candle[KLINE_START]) / 1000, float(candle[KLINE_OPEN]))
+
+    def is_warm(self, now: float, tolerance: float = 60) -> bool:
+        """
+        Check whether the reference sample is close to the window start
+
+        A window that wasn't fed for a while (e.g. a coin not scanned while
+        a position was held) keeps a reference sample far older than the
+        window, which would give a stale change, so it isn't warm either.
+
+        Args:
+            now: current time in seconds since epoch
+            tolerance: allowed gap between reference sample and window start in seconds
+        """
+        if not self.samples:
+            return False
+        age = now - self.samples[0][0]
+        return self.seconds - tolerance <= age <= self.seconds + tolerance
+
+    def reference(self) -> float:
+        """
+        Get the reference price at the window start
+
+        Returns:
+            reference price, or NaN if the window is empty
+        """
+        return self.samples[0][1] if self.samples else float("nan")
+
+    def change(self, price: float) -> float:
+        """
+        Get percentage change of price relative to the window start
+
+        Args:
+            price: current price
+
+        Returns:
+            price change percentage
+        """
+        reference = self.samples[0][1]
+        return ((price - reference) / reference) * 100
+
+
+def load_price_history(
+    helper: BybitHelper, category: str, symbol: str, windows: list
+):
+    """
+    Warm up price windows for a symbol from 1-minute candles
+
+    Args:
+        helper: BybitHelper instance
+        category: market category (e.g., "spot")
+        symbol: trading symbol (e.g., "XRPUSDT")
+        windows: list of PriceWindow instances to fill
+    """
+    try:
+        minutes = int(max(window.seconds for window in windows) // 60)
+        candles = safe_get_klines(helper, category, symbol, "1", minutes + 1)
+        for window in windows:
+            window.warm_up(candles)
+    except Exception as e:
+        logging.warning(f"Could not load price history for {symbol}: {str(e)}")
+
+
+def _error_chain(error: BaseException | None):
+    while error is not None:
+        yield error
+        error = error.__cause__ or error.__context__
+
+
+def is_auth_error(error: BaseException | None) -> bool:
+    """
+    Check if an error, or any error it was raised from, is an API authentication failure
+
+    Helper methods wrap pybit exceptions into RuntimeError, so the whole
+    exception chain is inspected.
+
+    Args:
+        error: exception to check
+
+    Returns:
+        True if retrying can't succeed without fixing the API keys
+    """
+    for e in _error_chain(error):
+        if isinstance(e, exceptions.InvalidRequestError) and e.status_code in AUTH_ERROR_CODES:
+            return True
+        # HTTP 403 is Bybit's IP rate limit, not a key problem
+        if isinstance(e, exceptions.FailedRequestError) and e.status_code == 401:
+            return True
+    return False
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Check if an error may go away when the request is repeated
+
+    Args:
+        error: exception to check
+
+    Returns:
+        False for authentication failures and client HTTP errors other than throttling
+    """
+    if is_auth_error(error):
+        return False
+    for e in _error_chain(error):
+        if isinstance(e, exceptions.FailedRequestError):
+            status = e.status_code
+        elif isinstance(e, requests.HTTPError) and e.response is not None:
+            status = e.response.status_code
+        else:
+            continue
+        if isinstance(status, int) and 400 <= status < 500:
+            return status in RETRYABLE_HTTP_STATUSES
+    return True
+
+
+def get_retry_after(error: BaseException) -> float | None:
+    """
+    Get the wait time requested by the server for a throttled request
+
+    Args:
+        error: exception to check
+
+    Returns:
+        seconds to wait from Retry-After or Bybit limit reset headers, None if not throttled
+    """
+    for e in _error_chain(error):
+        if isinstance(e, requests.HTTPError) and e.response is not None:
+            status, headers = e.response.status_code, e.response.headers
+        elif isinstance(e, (exceptions.FailedRequestError, exceptions.InvalidRequestError)):
+            status, headers = e.status_code, getattr(e, "resp_headers", None)
+        else:
+            continue
+        if status not in RETRYABLE_HTTP_STATUSES and status not in RATE_LIMIT_CODES:
+            continue
+        if not headers:
+            return None
+        try:
+            if headers.get("Retry-After") is not None:
+                return float(headers["Retry-After"])
+            if headers.get("X-Bapi-Limit-Reset-Timestamp") is not None:
+                return max(0.0, int(headers["X-Bapi-Limit-Reset-Timestamp"]) / 1000 - time.time())
+        except (TypeError, ValueError):
+            pass
+        return None
+    return None
+
+
 def retry_on_error(max_retries=3, delay=5):
     """
     Decorator for retrying operations on error
 
+    Waits grow exponentially from delay, unless the server says how long
+    to wait. Errors that can't succeed on retry are raised immediately.
+
     Args:
         max_retries: maximum number of retry attempts
-        delay: delay between retries in seconds
+        delay: delay before the first retry in seconds
     """
 
     def decorator(func):
         def wrapper(*args, **kwargs):
             retries = 0
-            while retries < max_retries:
+            # The loop only decides anything after a failure, so a successful
+            # call costs just the try block
+            while True:
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
                     retries += 1
-                    if retries == max_retries:
+                    if not is_retryable_error(e):
+                        raise
+                    # Lazy %-style arguments: messages are only built if a handler
+                    # accepts the record, and no traceback is formatted
+                    if retries >= max_retries:
                         logging.error(
-                            f"Maximum retry attempts reached ({max_retries}). Last error: {str(e)}"
+                            "Maximum retry attempts reached (%d). Last error: %s", max_retries, e
                         )
                         raise
-                    wait_time = delay + random.uniform(0, 2)  # Add random jitter
+                    wait_time = get_retry_after(e)
+                    if wait_time is None:
+                        # Exponential backoff with random jitter
+                        wait_time = delay * 2 ** (retries - 1) + random.uniform(0, 2)
+                    wait_time = min(wait_time, MAX_RETRY_DELAY)
                     logging.warning(
-                        f"Error executing {func.__name__}: {str(e)}. Retry {retries}/{max_retries} in {wait_time:.1f} sec..."
+                        "Error executing %s: %s. Retry %d/%d in %.1f sec...",
+                        func.__name__, e, retries, max_retries, wait_time,
                     )
                     time.sleep(wait_time)
-            return None
 
         return wrapper
 
     return decorator
 
 
+def error_backoff(attempt: int, base: float, cap: float = MAX_RETRY_DELAY) -> float:
+    """
+    Get a wait after a failed strategy iteration
+
+    Args:
+        attempt: number of failures in a row, starting at 1
+        base: wait after the first failure in seconds
+        cap: upper bound for the exponential part in seconds
+
+    Returns:
+        base doubled per further failure up to cap, plus up to base of random
+        jitter so bots hit by the same outage don't retry in lockstep
+    """
+    return min(cap, base * 2 ** min(attempt - 1, 10)) + random.uniform(0, base)
+
+
+def wait_next_tick(deadline: float, interval: float) -> float:
+    """
+    Sleep until the next tick of a fixed-rate schedule
+
+    Sleeping until a monotonic deadline keeps the polling cadence independent
+    of how long the iteration took. If the schedule fell behind by more than
+    one interval, missed ticks are skipped instead of run back to back.
+
+    Args:
+        deadline: monotonic time of the current tick
+        interval: tick interval in seconds
+
+    Returns:
+        monotonic time of the next tick
+    """
+    deadline += interval
+    now = time.monotonic()
+    if now - deadline > interval:
+        deadline = now
+    _stop_event.wait(max(0.0, deadline - now))
+    return deadline
+
+
 @retry_on_error(max_retries=3, delay=5)
 def safe_get_price(helper: BybitHelper, category: str, symbol: str) -> float:
     """Safe price retrieval with retry mechanism"""
@@ -145,10 +495,528 @@ def safe_get_price_change(
     return helper.get_price_change(category, symbol, hours)
 
 
+def cached_price_change(
+    helper: BybitHelper, category: str, symbol: str, hours: int
+) -> float:
+    """
+    Get price change over a period, reusing recent results
+
+    A change over hours barely moves within seconds, so results are kept
+    for 1/120 of the period, at most one minute (30 seconds for 1 hour).
+    The status line's monitoring period change goes through here, so it
+    costs one request per TTL, not one per tick. The TTL isn't stretched
+    for that log-only value: the same entries feed entry decisions while
+    the price windows are still warming up.
+
+    Args:
+        helper: BybitHelper instance
+        category: market category (e.g., "spot")
+        symbol: trading symbol (e.g., "XRPUSDT")
+        hours: period in hours
+
+    Returns:
+        price change percentage
+    """
+    key = (category, symbol, hours)
+    now = time.monotonic()
+    entry = _price_change_cache.get(key)
+    if entry is not None and now < entry[0]:
+        return entry[1]
+
+    change = safe_get_price_change(helper, category, symbol, hours)
+    _price_change_cache[key] = (now + min(hours * 3600 / 120, 60), change)
+    return change
+
+
+@retry_on_error(max_retries=3, delay=5)
+def safe_get_klines(
+    helper: BybitHelper, category: str, symbol: str, interval: str, limit: int
+) -> list:
+    """Safe candles retrieval with retry mechanism"""
+    return helper.get_klines(category, symbol, interval, limit)
+
+
 @retry_on_error(max_retries=3, delay=5)
-def safe_place_order(helper: BybitHelper, **kwargs):
-    """Safe order placement with retry mechanism"""
-    return helper.place_order(**kwargs)
+def safe_fetch_all_tickers(helper: BybitHelper, category: str) -> dict:
+    """Safe tickers retrieval with retry mechanism"""
+    return helper.fetch_all_tickers(category)
+
+
+@retry_on_error(max_retries=3, delay=5)
+def safe_get_order(
+    helper: BybitHelper, category: str, order_id: str | None = None, order_link_id: str | None = None
+) -> dict | None:
+    """Safe order lookup with retry mechanism"""
+    return helper.get_order(category, order_id, order_link_id)
+
+
+def prepare_order(helper: BybitHelper, **kwargs) -> dict | None:
+    """
+    Prepare an order draft ahead of the trading decision
+
+    Args:
+        helper: BybitHelper instance
+        **kwargs: order parameters for BybitHelper.prepare_order_draft
+
+    Returns:
+        order draft, or None if it could not be prepared
+    """
+    try:
+        return helper.prepare_order_draft(**kwargs)
+    except Exception as e:
+        logging.warning(
+            f"Could not prepare {kwargs.get('side')} order for {kwargs.get('symbol')}: {str(e)}"
+        )
+        return None
+
+
+def send_order(helper: BybitHelper, draft: dict | None, **kwargs):
+    """
+    Send a prepared order draft, or place the order directly if the draft doesn't match
+
+    The order carries a fresh orderLinkId. A timeout or server error may
+    come after the exchange accepted the order, so it is only resent once
+    the order history shows no order with that ID; a rejection by the
+    exchange is never resent.
+
+    Args:
+        helper: BybitHelper instance
+        draft: order draft from prepare_order (or None)
+        **kwargs: order parameters for BybitHelper.place_order
+
+    Returns:
+        order placement response
+
+    Raises:
+        Exception: if the order is rejected, or can't be sent and wasn't placed
+    """
+    order_link_id = uuid.uuid4().hex
+    if (
+        draft is not None
+        and draft["symbol"] == kwargs.get("symbol")
+        and draft["side"] == kwargs.get("side")
+        and draft["qty"] == kwargs.get("qty")
+    ):
+        def send():
+            return helper.send_order_draft(draft, order_link_id)
+    else:
+        def send():
+            return helper.place_order(order_link_id=order_link_id, **kwargs)
+
+    for attempt in range(1, ORDER_SEND_ATTEMPTS + 1):
+        try:
+            return send()
+        except Exception as e:
+            rejected = any(isinstance(c, exceptions.InvalidRequestError) for c in _error_chain(e))
+            if rejected or not is_retryable_error(e) or attempt == ORDER_SEND_ATTEMPTS:
+                raise
+            # Raises if the order history can't be read: the order may be live
+            order = safe_get_order(helper, kwargs["category"], order_link_id=order_link_id)
+            if order is not None:
+                logging.warning(f"Order {order_link_id} was placed despite error: {str(e)}")
+                return {
+                    "retCode": 0,
+                    "retMsg": "OK",
+                    "result": {"orderId": order.get("orderId"), "orderLinkId": order_link_id},
+                }
+            wait_time = get_retry_after(e)
+            if wait_time is None:
+                wait_time = error_backoff(attempt, 1)
+            logging.warning(
+                "Error sending order %s: %s. Not placed, resending in %.1f sec...",
+                order_link_id, e, wait_time,
+            )
+            time.sleep(min(wait_time, MAX_RETRY_DELAY))
+
+
+def execute_buy(
+    helper: BybitHelper,
+    draft: dict | None,
+    category: str,
+    coin: str,
+    buy_amount: float,
+    current_price: float,
+) -> float:
+    """
+    Buy a coin for an amount of USDT with a market order
+
+    Once the order is accepted this doesn't raise: the coins are bought
+    and have to be tracked, so if the fill can't be read the position is
+    taken from the coin's wallet balance, or as a last resort estimated
+    from the price net of fee and slippage. Both are rounded down to the
+    quantity precision, so the exit order never asks for more than is held.
+
+    Args:
+        helper: BybitHelper instance
+        draft: order prepared with prepare_order, or None to place it from scratch
+        category: market category (e.g., "spot")
+        coin: coin name (e.g., "XRP")
+        buy_amount: amount in USDT to buy
+        current_price: price the entry was decided at, for the fallback estimate
+
+    Returns:
+        exact amount of coins bought, net of fees; 0.0 if the order was
+        closed without any fill
+
+    Raises:
+        Exception: if the order is rejected
+    """
+    logging.info("Placing buy order...")
+
+    r = send_order(
+        helper,
+        draft,
+        category=category,
+        symbol=f"{coin}USDT",
+        side="Buy",
+        order_type="Market",
+        qty=buy_amount,
+        market_unit="quoteCoin",
+    )
+
+    if r.get("retCode") != 0:
+        logging.error(f"\nError placing buy order: {r.get('retMsg')}")
+        raise Exception(f"Order placement error: {r.get('retMsg')}")
+
+    order_id = r.get("result", {}).get("orderId")
+    logging.info(f"Buy order placed successfully. ID: {order_id}")
+
+    # Read the order's own cumulative fill rather than diffing wallet
+    # balances, which other activity on the account could change in between.
+    # Executions of one order may be reported over several polls, so the
+    # quantity is only taken once the order status is final
+    try:
+        for _ in range(FILL_POLL_ATTEMPTS):
+            order = safe_get_order(helper, category, order_id)
+            if order is not None and order.get("orderStatus") in FINAL_ORDER_STATUSES:
+                # Spot buys pay the fee in the coin bought
+                bought_amount = float(order.get("cumExecQty") or 0) - float(order.get("cumExecFee") or 0)
+                logging.info(f"Exact amount bought: {format_price(bought_amount)} {coin}")
+                return bought_amount
+            time.sleep(FILL_POLL_INTERVAL)
+        reason = "order did not reach a final status"
+    except Exception as e:
+        reason = str(e)
+
+    decimals = get_quantity_decimals(coin, helper)
+    try:
+        bought_amount = helper.round_down(helper.get_wallet_balance(coin), decimals)
+        source = "wallet balance"
+    except Exception as e:
+        logging.warning(f"Could not read {coin} wallet balance: {str(e)}")
+        bought_amount = helper.round_down(
+            buy_amount / current_price * (1 - FALLBACK_FEE_RATE), decimals
+        )
+        source = "fee-adjusted estimate"
+    logging.warning(
+        f"Could not read fill of buy order {order_id} ({reason}), "
+        f"using {source} of {format_price(bought_amount)} {coin} as position size"
+    )
+    return bought_amount
+
+
+def get_quantity_decimals(coin: str, helper: BybitHelper | None = None) -> int:
+    """
+    Get number of decimal places used to round order quantity for a coin
+
+    Uses the spot instrument's base precision when a helper is given,
+    otherwise a fixed table.
+
+    Args:
+        coin: coin name (e.g., "XRP")
+        helper: BybitHelper instance to read instrument precision with
+
+    Returns:
+        number of decimal places
+    """
+    if helper is not None:
+        try:
+            return helper.get_quantity_decimals("spot", f"{coin}USDT")
+        except Exception as e:
+            logging.warning(f"Could not get quantity precision for {coin}: {str(e)}")
+    return QUANTITY_DECIMALS.get(coin, DEFAULT_QUANTITY_DECIMALS)
+
+
+def underwater_wait(
+    total_change_from_entry: float, minimum_profit_threshold: float, check_interval: float
+) -> float | None:
+    """
+    Get a longer wait for a position far below minimum profit
+
+    Args:
+        total_change_from_entry: position change from entry price in percent
+        minimum_profit_threshold: profit activating the trailing stop in percent
+        check_interval: regular wait in seconds
+
+    Returns:
+        wait in seconds, check_interval scaled by how far the gap to minimum
+        profit exceeds UNDERWATER_GAP_RATIO of it, or None if that wouldn't
+        lengthen the regular interval
+    """
+    profit_gap = minimum_profit_threshold - total_change_from_entry
+    wait = check_interval * profit_gap / (minimum_profit_threshold * UNDERWATER_GAP_RATIO)
+    if wait <= check_interval:
+        return None
+    return wait
+
+
+def trailing_step(
+    price: float,
+    entry_price: float,
+    trailing_price: float,
+    trailing_activated: bool,
+    minimum_profit_ratio: float,
+    trailing_update_ratio: float,
+    trailing_drop_ratio: float,
+) -> tuple:
+    """
+    Decide what a held position does on a new price
+
+    Pure arithmetic, compiled with numba when it is installed; the caller
+    does the logging and order placement for the returned action.
+
+    Args:
+        price: current price
+        entry_price: position entry price
+        trailing_price: current trailing point
+        trailing_activated: whether minimum profit was reached before
+        minimum_profit_ratio: price to entry ratio activating the trailing stop
+        trailing_update_ratio: price to trailing ratio moving the trailing point up
+        trailing_drop_ratio: price to trailing ratio selling an activated position
+
+    Returns:
+        tuple: (trailing_price, trailing_activated, action), action is one of
+        TRAILING_HOLD, TRAILING_UPDATE or TRAILING_SELL
+    """
+    if not trailing_activated and price >= entry_price * minimum_profit_ratio:
+        trailing_activated = True
+    if price >= trailing_price * trailing_update_ratio:
+        return price, trailing_activated, TRAILING_UPDATE
+    if trailing_activated and price <= trailing_price * trailing_drop_ratio:
+        return trailing_price, trailing_activated, TRAILING_SELL
+    return trailing_price, trailing_activated, TRAILING_HOLD
+
+
+if njit is not None:
+    # Compiled once and cached on disk, so later runs skip the JIT cost
+    trailing_step = njit(
+        "Tuple((float64, boolean, int64))(float64, float64, float64, boolean, float64, float64, float64)",
+        cache=True,
+    )(trailing_step)
+
+
+def keep_connection_warm(helper: BybitHelper, last_warm_up: float) -> float:
+    """
+    Refresh the REST connection in the background if it has been idle
+
+    While prices come from the ticker stream, nothing else may use the
+    HTTP connection and the server drops it; the exit order then pays
+    for a new handshake at the worst moment.
+
+    Args:
+        helper: BybitHelper instance
+        last_warm_up: monotonic time of the previous refresh
+
+    Returns:
+        monotonic time of the latest refresh
+    """
+    now = time.monotonic()
+    if now - last_warm_up < CONNECTION_KEEPALIVE_INTERVAL:
+        return last_warm_up
+    _executor.submit(helper.warm_up_connection)
+    return now
+
+
+def get_current_price(
+    helper: BybitHelper, stream: PriceStream, category: str, symbol: str
+) -> float:
+    """
+    Get current price from the ticker stream, falling back to REST
+
+    Args:
+        helper: BybitHelper instance
+        stream: PriceStream subscribed to the symbol
+        category: market category (e.g., "spot")
+        symbol: trading symbol (e.g., "XRPUSDT")
+
+    Returns:
+        current price
+    """
+    price = stream.get(symbol)
+    if price is None:
+        price = safe_get_price(helper, category, symbol)
+    return price
+
+
+def info_enabled() -> bool:
+    """
+    Check if INFO records are logged, so per-tick status lines can be skipped
+    before formatting prices or fetching values shown only in the log
+    """
+    return logging.getLogger().isEnabledFor(logging.INFO)
+
+
+@dataclass(slots=True)
+class PositionState:
+    """
+    Open position of the whitelist strategy, coin is None while scanning
+    """
+
+    coin: str | None = None
+    entry_price: float | None = None
+    trailing_price: float | None = None
+    position_size: float | None = None
+    trailing_activated: bool = False
+
+    @classmethod
+    def from_saved(cls, saved: dict | None) -> "PositionState":
+        """
+        Create state from a position saved by persist_position
+
+        Args:
+            saved: saved state, or None for no position
+
+        Returns:
+            PositionState instance
+        """
+        return cls(**saved) if saved else cls()
+
+    def reset(self):
+        """
+        Forget the position and go back to scanning
+        """
+        self.coin = None
+        self.entry_price = None
+        self.trailing_price = None
+        self.position_size = None
+        self.trailing_activated = False
+
+
+def restore_position(saved: dict | None) -> tuple:
+    """
+    Get position variables from saved strategy state
+
+    Args:
+        saved: state saved by persist_position, or None
+
+    Returns:
+        tuple of (entry_price, trailing_price, position_size, trailing_activated)
+    """
+    if not saved:
+        return None, None, None, False
+    return (
+        saved["entry_price"],
+        saved["trailing_price"],
+        saved["position_size"],
+        saved["trailing_activated"],
+    )
+
+
+def persist_position(name: str, position: dict, saved: dict | None) -> dict | None:
+    """
+    Save the open position if it changed, or remove it once closed
+
+    Args:
+        name: state name (e.g., "XRPUSDT")
+        position: current position variables, entry_price is None without a position
+        saved: state saved previously, or None
+
+    Returns:
+        state saved now, or None if there is no open position
+    """
+    if position["entry_price"] is None:
+        if saved is not None:
+            clear_state(name)
+        return None
+    if position != saved:
+        save_state(name, position)
+    return position
+
+
+def submit_price_changes(
+    helper: BybitHelper, category: str, symbol: str, hours_period: int, quick_period: int
+) -> tuple[Future, Future]:
+    """
+    Submit price change requests for two periods to the shared I/O pool
+
+    Args:
+        helper: BybitHelper instance
+        category: market category (e.g., "spot")
+        symbol: trading symbol (e.g., "XRPUSDT")
+        hours_period: long period for price change in hours
+        quick_period: short period for price change in hours
+
+    Returns:
+        futures for (price_change, quick_price_change)
+    """
+    return (
+        _executor.submit(cached_price_change, helper, category, symbol, hours_period),
+        _executor.submit(cached_price_change, helper, category, symbol, quick_period),
+    )
+
+
+def submit_market_data(
+    helper: BybitHelper, category: str, symbol: str, hours_period: int, quick_period: int
+) -> tuple[Future, Future, Future]:
+    """
+    Submit current price and price change requests to the shared I/O pool
+
+    Args:
+        helper: BybitHelper instance
+        category: market category (e.g., "spot")
+        symbol: trading symbol (e.g., "XRPUSDT")
+        hours_period: long period for price change in hours
+        quick_period: short period for price change in hours
+
+    Returns:
+        futures for (current_price, price_change, quick_price_change)
+    """
+    return (
+        _executor.submit(safe_get_price, helper, category, symbol),
+        *submit_price_changes(helper, category, symbol, hours_period, quick_period),
+    )
+
+
+def fetch_market_data(
+    helper: BybitHelper, category: str, symbol: str, hours_period: int, quick_period: int
+) -> tuple[float, float, float]:
+    """
+    Fetch current price and price changes for two periods concurrently
+
+    Args:
+        helper: BybitHelper instance
+        category: market category (e.g., "spot")
+        symbol: trading symbol (e.g., "XRPUSDT")
+        hours_period: long period for price change in hours
+        quick_period: short period for price change in hours
+
+    Returns:
+        tuple of (current_price, price_change, quick_price_change)
+    """
+    price_future, change_future, quick_change_future = submit_market_data(
+        helper, category, symbol, hours_period, quick_period
+    )
+    return price_future.result(), change_future.result(), quick_change_future.result()
+
+
+def prefetch_instrument_info(helper: BybitHelper, category: str, symbols: list):
+    """
+    Load instrument information for all symbols concurrently, warming the helper cache
+
+    Args:
+        helper: BybitHelper instance
+        category: market category (e.g., "spot")
+        symbols: list of trading symbols (e.g., ["XRPUSDT", "ETHUSDT"])
+    """
+    futures = {
+        symbol: _executor.submit(helper.get_instrument_info, category, symbol)
+        for symbol in symbols
+    }
+    for symbol, future in futures.items():
+        try:
+            future.result()
+        except Exception as e:
+            logging.warning(f"Could not prefetch instrument info for {symbol}: {str(e)}")
 
 
 def run_trailing_stop_strategy(
@@ -222,11 +1090,18 @@ def run_trailing_stop_strategy(
     trailing_update_threshold = 3  # threshold to update trailing stop (%)
     trailing_drop_threshold = -1  # price drop threshold for trailing stop (%)
     monitoring_period = 1  # period for tracking price change after entry
+    # thresholds as price ratios, so exit decisions are a multiply and compare per tick
+    minimum_profit_ratio = 1 + minimum_profit_threshold / 100
+    trailing_update_ratio = 1 + trailing_update_threshold / 100
+    trailing_drop_ratio = 1 + trailing_drop_threshold / 100
     entry_price = None  # position entry price
     trailing_price = None  # trailing stop price
     position_size = None  # amount of coins bought
     trailing_activated = False  # whether trailing stop is activated
 
+    # Per-tick status lines get the symbol as a log record field
+    log = logging.LoggerAdapter(logging.getLogger(), {"symbol": symbol})
+
     logging.info(f"Starting algorithm for {symbol}")
     logging.info(
         f"Position entry conditions:\n"
@@ -240,292 +1115,365 @@ def run_trailing_stop_strategy(
         f"- Trailing drop threshold: {trailing_drop_threshold}%"
     )
 
-    consecutive_errors = 0
-    max_consecutive_errors = 5
-
-    while True:
-        try:
-            # Get current price and changes over different periods
-            current_price = safe_get_price(helper, category, symbol)
-            price_change = safe_get_price_change(
-                helper, category, symbol, hours=hours_period
-            )
-            quick_price_change = safe_get_price_change(
-                helper, category, symbol, hours=quick_period
-            )
+    # Prepare orders ahead of time so only timestamp and signature are added on send
+    buy_draft = prepare_order(
+        helper,
+        category=category,
+        symbol=symbol,
+        side="Buy",
+        order_type="Market",
+        qty=buy_amount,
+        market_unit="quoteCoin",
+    )
+    sell_draft = None
+
+    # Resume a position left open by a previous run
+    saved_position = load_state(symbol)
+    entry_price, trailing_price, position_size, trailing_activated = restore_position(saved_position)
+    if entry_price is not None:
+        logging.info(
+            f"Resumed position: {format_price(position_size)} {coin} at {format_price(entry_price)} USDT"
+        )
 
-            # Reset error counter on successful execution
-            consecutive_errors = 0
+    # Keep recent price history locally so price changes don't need REST calls every tick
+    long_window = PriceWindow(hours_period)
+    quick_window = PriceWindow(quick_period)
+    load_price_history(helper, category, symbol, [long_window, quick_window])
 
-            # Format time for output
-            current_time = datetime.now().strftime("%H:%M:%S")
+    # Prices are pushed over WebSocket; REST is only used while the stream is down
+    price_stream = PriceStream(category, [symbol])
+    price_stream.start()
 
-            if entry_price is None:
-                # If not in position, look for entry opportunity
-                logging.info(
-                    f"[{current_time}] {symbol} Price: {format_price(current_price)} USDT "
-                    f"(Change over {hours_period}h: {format_price(price_change)}%, "
-                    f"over {quick_period}h: {format_price(quick_price_change)}%)"
-                )
+    # Bound once, called every tick
+    add_long, add_quick = long_window.add, quick_window.add
+    wait_for_cross = price_stream.wait_for_cross
 
-                # Check entry conditions
-                if quick_price_change >= quick_rise_threshold:
-                    logging.info(
-                        f"\nQuick rise! Price increased by {format_price(quick_price_change)}% in the last hour. Checking order requirements..."
-                    )
+    consecutive_errors = 0
+    max_consecutive_errors = 5
+    restarts = 0
+    healthy_iterations = 0
+    deadline = time.monotonic()
+    last_warm_up = deadline
 
-                    # Check minimum order size before placing order
-                    if not check_minimum_order_size(helper, symbol, buy_amount):
-                        logging.error(f"Cannot place order for {symbol} - minimum order requirements not met")
-                        time.sleep(check_interval)
-                        continue
-
-                    logging.info("Placing buy order...")
-
-                    # Get wallet balance before buying
-                    balance_before = helper.get_wallet_balance(coin)
-                    logging.info(f"Balance before buying: {format_price(balance_before)} {coin}")
-
-                    r = safe_place_order(
-                        helper,
-                        category=category,
-                        symbol=symbol,
-                        side="Buy",
-                        order_type="Market",
-                        qty=buy_amount,
-                        market_unit="quoteCoin",
+    _active_streams.add(price_stream)
+    try:
+        while not _stop_event.is_set():
+            try:
+                wait_interval = check_interval
+                # Get current price and changes over different periods. Log lines take
+                # their time from the formatter's asctime, so no timestamp is built here;
+                # wall-clock time is needed because window samples line up with candle times
+                now = time.time()
+                if long_window.is_warm(now) and quick_window.is_warm(now):
+                    current_price = get_current_price(helper, price_stream, category, symbol)
+                    add_long(now, current_price)
+                    add_quick(now, current_price)
+                    price_change = long_window.change(current_price)
+                    quick_price_change = quick_window.change(current_price)
+                else:
+                    # Fall back to server-side price changes until history covers both periods
+                    current_price, price_change, quick_price_change = fetch_market_data(
+                        helper, category, symbol, hours_period, quick_period
                     )
+                    add_long(now, current_price)
+                    add_quick(now, current_price)
 
-                    if r.get("retCode") != 0:
-                        error_msg = f"\nError placing buy order: {r.get('retMsg')}"
-                        logging.error(error_msg)
-                        raise Exception(f"Order placement error: {r.get('retMsg')}")
-
-                    order_id = r.get("result", {}).get("orderId")
-                    logging.info(f"Buy order placed successfully. ID: {order_id}")
-
-                    # Get wallet balance after buying
-                    balance_after = helper.get_wallet_balance(coin)
-                    logging.info(f"Balance after buying: {format_price(balance_after)} {coin}")
-
-                    # Calculate exact amount bought
-                    bought_amount = balance_after - balance_before
-                    logging.info(f"Exact amount bought: {format_price(bought_amount)} {coin}")
+                # Reset error counters on successful execution; restart backoff
+                # only after a sustained healthy period, so a flapping outage escalates
+                consecutive_errors = 0
+                healthy_iterations += 1
+                if healthy_iterations >= RESTART_RESET_ITERATIONS:
+                    restarts = 0
+
+                if entry_price is None:
+                    # If not in position, look for entry opportunity
+                    # (timestamp is added by the log formatter)
+                    if info_enabled():
+                        log.info(
+                            "Price: %s USDT (Change over %sh: %s%%, over %sh: %s%%)",
+                            format_price(current_price),
+                            hours_period,
+                            format_price(price_change),
+                            quick_period,
+                            format_price(quick_price_change),
+                        )
 
-                    entry_price = current_price
-                    trailing_price = current_price
-                    position_size = (
-                        bought_amount  # Use actual bought amount instead of calculation
+                    # Check entry conditions
+                    entry_signal = True
+                    if quick_price_change >= quick_rise_threshold:
+                        logging.info(
+                            f"\nQuick rise! Price increased by {format_price(quick_price_change)}% in the last hour. Checking order requirements..."
+                        )
+                    elif price_change <= price_drop_threshold:
+                        logging.info(
+                            f"\nPrice dropped by {abs(price_change):.2f}% over {hours_period} hours. Checking order requirements..."
+                        )
+                    else:
+                        entry_signal = False
+                        logging.debug(" (Waiting for signal)")
+
+                    if entry_signal:
+                        # Check minimum order size before placing order
+                        if not check_minimum_order_size(helper, symbol, buy_amount, current_price):
+                            logging.error(f"Cannot place order for {symbol} - minimum order requirements not met")
+                            deadline = wait_next_tick(deadline, check_interval)
+                            continue
+
+                        # Use actual bought amount instead of calculation
+                        bought_amount = execute_buy(
+                            helper, buy_draft, category, coin, buy_amount, current_price
+                        )
+                        if bought_amount <= 0:
+                            logging.error(f"Buy order for {symbol} was closed without fills")
+                            deadline = wait_next_tick(deadline, check_interval)
+                            continue
+                        position_size = bought_amount
+                        entry_price = current_price
+                        trailing_price = current_price
+                        trailing_activated = False  # Reset trailing activation
+                        # Save the position right away, so an error below can't lose it
+                        saved_position = persist_position(
+                            symbol,
+                            {
+                                "entry_price": entry_price,
+                                "trailing_price": trailing_price,
+                                "position_size": position_size,
+                                "trailing_activated": trailing_activated,
+                            },
+                            saved_position,
+                        )
+                        logging.info(f"Entered position at price: {format_price(entry_price)} USDT")
+                        logging.info(f"Position size: {format_price(position_size)} {coin}")
+
+                        sell_draft = prepare_order(
+                            helper,
+                            category=category,
+                            symbol=symbol,
+                            side="Sell",
+                            order_type="Market",
+                            qty=helper.round_down(position_size, get_quantity_decimals(coin, helper)),
+                            market_unit="baseCoin",
+                        )
+                else:
+                    # If in position, check trailing or exit conditions
+                    last_warm_up = keep_connection_warm(helper, last_warm_up)
+                    # Percent changes are for log messages only; decisions below
+                    # compare prices against the precomputed threshold ratios
+                    price_change_from_trailing = (
+                        ((current_price - trailing_price) / trailing_price) * 100
+                        if trailing_price is not None
+                        else 0.0
                     )
-                    trailing_activated = False  # Reset trailing activation
-                    logging.info(f"Entered position at price: {format_price(entry_price)} USDT")
-                    logging.info(f"Position size: {format_price(position_size)} {coin}")
-
-                elif price_change <= price_drop_threshold:
-                    logging.info(
-                        f"\nPrice dropped by {abs(price_change):.2f}% over {hours_period} hours. Checking order requirements..."
+                    total_change_from_entry = (
+                        ((current_price - entry_price) / entry_price) * 100
+                        if entry_price is not None
+                        else 0.0
                     )
 
-                    # Check minimum order size before placing order
-                    if not check_minimum_order_size(helper, symbol, buy_amount):
-                        logging.error(f"Cannot place order for {symbol} - minimum order requirements not met")
-                        time.sleep(check_interval)
-                        continue
-
-                    logging.info("Placing buy order...")
-
-                    # Get wallet balance before buying
-                    balance_before = helper.get_wallet_balance(coin)
-                    logging.info(f"Balance before buying: {format_price(balance_before)} {coin}")
-
-                    r = safe_place_order(
-                        helper,
-                        category=category,
-                        symbol=symbol,
-                        side="Buy",
-                        order_type="Market",
-                        qty=buy_amount,
-                        market_unit="quoteCoin",
+                    # Activate trailing stop once minimum profit is reached, and
+                    # decide on the trailing point against the previous one
+                    was_activated = trailing_activated
+                    old_trailing = trailing_price
+                    trailing_price, trailing_activated, action = trailing_step(
+                        current_price,
+                        entry_price,
+                        trailing_price,
+                        trailing_activated,
+                        minimum_profit_ratio,
+                        trailing_update_ratio,
+                        trailing_drop_ratio,
                     )
+                    if trailing_activated and not was_activated:
+                        logging.info(
+                            "\n🟢 Minimum profit reached! Profit: %s%% >= %s%%",
+                            LazyPrice(total_change_from_entry),
+                            minimum_profit_threshold,
+                        )
+                        logging.info("Trailing stop mechanism activated!")
 
-                    if r.get("retCode") != 0:
-                        error_msg = f"\nError placing buy order: {r.get('retMsg')}"
-                        logging.error(error_msg)
-                        raise Exception(f"Order placement error: {r.get('retMsg')}")
-
-                    order_id = r.get("result", {}).get("orderId")
-                    logging.info(f"Buy order placed successfully. ID: {order_id}")
-
-                    # Get wallet balance after buying
-                    balance_after = helper.get_wallet_balance(coin)
-                    logging.info(f"Balance after buying: {format_price(balance_after)} {coin}")
-
-                    # Calculate exact amount bought
-                    bought_amount = balance_after - balance_before
-                    logging.info(f"Exact amount bought: {format_price(bought_amount)} {coin}")
-
-                    entry_price = current_price
-                    trailing_price = current_price
-                    position_size = (
-                        bought_amount  # Use actual bought amount instead of calculation
+                    # Far below minimum profit: poll less often and skip the status line
+                    slow_wait = (
+                        None
+                        if trailing_activated
+                        else underwater_wait(total_change_from_entry, minimum_profit_threshold, check_interval)
                     )
-                    trailing_activated = False  # Reset trailing activation
-                    logging.info(f"Entered position at price: {format_price(entry_price)} USDT")
-                    logging.info(f"Position size: {format_price(position_size)} {coin}")
-                else:
-                    logging.info(" (Waiting for signal)")
-            else:
-                # If in position, check trailing or exit conditions
-                price_change_from_trailing = (
-                    ((current_price - trailing_price) / trailing_price) * 100
-                    if trailing_price is not None
-                    else 0.0
-                )
-                total_change_from_entry = (
-                    ((current_price - entry_price) / entry_price) * 100
-                    if entry_price is not None
-                    else 0.0
-                )
-
-                # Get price change for monitoring period
-                monitoring_price_change = safe_get_price_change(
-                    helper, category, symbol, hours=monitoring_period
-                )
+                    if slow_wait is not None:
+                        wait_interval = slow_wait
+
+                    if slow_wait is None and info_enabled():
+                        # Price change for monitoring period is only shown in the log;
+                        # the quick period change was already computed this tick
+                        if monitoring_period == quick_period:
+                            monitoring_price_change = quick_price_change
+                        else:
+                            monitoring_price_change = cached_price_change(
+                                helper, category, symbol, hours=monitoring_period
+                            )
+                        log.info(
+                            "Price: %s USDT (From entry: %s%%, From trailing: %s%%, Change over %sh: %s%%)",
+                            format_price(current_price),
+                            format_price(total_change_from_entry),
+                            format_price(price_change_from_trailing),
+                            monitoring_period,
+                            format_price(monitoring_price_change),
+                        )
 
-                # Determine status
-                if not trailing_activated:
-                    if total_change_from_entry >= minimum_profit_threshold:
-                        trailing_activated = True
+                    # Update trailing price if conditions are met
+                    if action == TRAILING_UPDATE:
                         logging.info(
-                            f"\n🟢 Minimum profit reached! Profit: {format_price(total_change_from_entry)}% >= {minimum_profit_threshold}%"
+                            "\nPrice increased by %s%% from last trailing point.",
+                            LazyPrice(price_change_from_trailing),
                         )
-                        logging.info("Trailing stop mechanism activated!")
-                    status_msg = f"(Waiting for {minimum_profit_threshold}% profit)"
-                else:
-                    status_msg = "(Trailing active)"
+                        logging.info(
+                            "Updating trailing point: %s -> %s USDT",
+                            LazyPrice(old_trailing),
+                            LazyPrice(trailing_price),
+                        )
+                        logging.info("Total profit from entry: %s%%", LazyPrice(total_change_from_entry))
 
-                logging.info(
-                    f"[{current_time}] {symbol} Price: {format_price(current_price)} USDT "
-                    f"(From entry: {format_price(total_change_from_entry)}%, "
-                    f"From trailing: {format_price(price_change_from_trailing)}%, "
-                    f"Change over {monitoring_period}h: {format_price(monitoring_price_change)}%)"
-                )
+                    # Check exit conditions only if trailing is activated
+                    elif action == TRAILING_SELL:
+                        # If price drops below threshold from maximum AND trailing is activated, sell
+                        logging.info(
+                            f"\n🔴 Price dropped by {abs(price_change_from_trailing):.2f}% from trailing point."
+                        )
+                        # Formatted once, logged again after the sell
+                        final_profit = format_price(total_change_from_entry)
+                        logging.info(f"Final profit: {final_profit}% (≥ {minimum_profit_threshold}%)")
+                        logging.info("Placing sell order.")
+
+                        # Use the exact position_size that was calculated after buying
+                        if position_size is None or position_size <= 0:
+                            logging.error(f"No {coin} position available for selling")
+                            # Reset position variables since we can't sell
+                            entry_price = None
+                            trailing_price = None
+                            position_size = None
+                            trailing_activated = False
+                            # Drop the saved position too, or a restart would resume it
+                            saved_position = persist_position(
+                                symbol,
+                                {
+                                    "entry_price": entry_price,
+                                    "trailing_price": trailing_price,
+                                    "position_size": position_size,
+                                    "trailing_activated": trailing_activated,
+                                },
+                                saved_position,
+                            )
+                            continue
+
+                        # Round quantity to proper decimal places based on coin type
+                        decimal_places = get_quantity_decimals(coin, helper)
+
+                        sell_quantity = helper.round_down(position_size, decimal_places)
+
+                        logging.info(f"Position size to sell: {format_price(position_size)} {coin}")
+                        logging.info(
+                            f"Selling quantity: {format_price(sell_quantity)} {coin} (rounded to {decimal_places} decimals)"
+                        )
 
-                # Check if we can activate trailing stop
-                if not trailing_activated and total_change_from_entry >= minimum_profit_threshold:
-                    trailing_activated = True
-                    logging.info(
-                        f"\n🟢 Minimum profit reached! Profit: {format_price(total_change_from_entry)}% >= {minimum_profit_threshold}%"
-                    )
-                    logging.info("Trailing stop mechanism activated!")
+                        r = send_order(
+                            helper,
+                            sell_draft,
+                            category=category,
+                            symbol=symbol,
+                            side="Sell",
+                            order_type="Market",
+                            qty=sell_quantity,
+                            market_unit="baseCoin",
+                        )
 
-                # Update trailing price if conditions are met
-                if price_change_from_trailing >= trailing_update_threshold:
-                    # Always update trailing if price rises above threshold
-                    old_trailing = trailing_price
-                    trailing_price = current_price
-                    logging.info(
-                        f"\nPrice increased by {format_price(price_change_from_trailing)}% from last trailing point."
-                    )
-                    logging.info(
-                        f"Updating trailing point: {format_price(old_trailing)} -> {format_price(trailing_price)} USDT"
-                    )
-                    logging.info(
-                        f"Total profit from entry: {format_price(total_change_from_entry)}%"
-                    )
+                        if r.get("retCode") != 0:
+                            error_msg = f"\nError placing sell order: {r.get('retMsg')}"
+                            logging.error(error_msg)
+                            raise Exception(f"Order placement error: {r.get('retMsg')}")
 
-                # Check exit conditions only if trailing is activated
-                elif trailing_activated and price_change_from_trailing <= trailing_drop_threshold:
-                    # If price drops below threshold from maximum AND trailing is activated, sell
-                    logging.info(
-                        f"\n🔴 Price dropped by {abs(price_change_from_trailing):.2f}% from trailing point."
-                    )
-                    logging.info(f"Final profit: {format_price(total_change_from_entry)}% (≥ {minimum_profit_threshold}%)")
-                    logging.info("Placing sell order.")
+                        order_id = r.get("result", {}).get("orderId")
+                        logging.info(f"Sell order placed successfully. ID: {order_id}")
 
-                    # Use the exact position_size that was calculated after buying
-                    if position_size is None or position_size <= 0:
-                        logging.error(f"No {coin} position available for selling")
-                        # Reset position variables since we can't sell
+                        logging.info(f"Closed position at price: {format_price(current_price)} USDT")
+                        logging.info(f"Final profit: {final_profit}%")
                         entry_price = None
                         trailing_price = None
                         position_size = None
                         trailing_activated = False
-                        continue
-
-                    # Round quantity to proper decimal places based on coin type
-                    if coin in ["BTC", "ETH"]:
-                        decimal_places = 6  # High-value coins need more precision
-                    elif coin in ["XRP", "ADA", "DOGE", "TRX"]:
-                        decimal_places = 1  # Low-value coins typically use 1 decimal
+                    elif not trailing_activated:
+                        logging.info(
+                            " (Need %.2f%% more for trailing activation)",
+                            minimum_profit_threshold - total_change_from_entry,
+                        )
                     else:
-                        decimal_places = 2  # Default for most coins
-
-                    sell_quantity = helper.round_down(position_size, decimal_places)
-
-                    logging.info(f"Position size to sell: {format_price(position_size)} {coin}")
-                    logging.info(
-                        f"Selling quantity: {format_price(sell_quantity)} {coin} (rounded to {decimal_places} decimals)"
-                    )
+                        logging.debug(" (Monitoring price)")
+
+                saved_position = persist_position(
+                    symbol,
+                    {
+                        "entry_price": entry_price,
+                        "trailing_price": trailing_price,
+                        "position_size": position_size,
+                        "trailing_activated": trailing_activated,
+                    },
+                    saved_position,
+                )
 
-                    r = safe_place_order(
-                        helper,
-                        category=category,
-                        symbol=symbol,
-                        side="Sell",
-                        order_type="Market",
-                        qty=sell_quantity,
-                        market_unit="baseCoin",
+                if trailing_price is not None:
+                    # Wake up on the tick that crosses a trailing level instead of the next poll
+                    wait_for_cross(
+                        symbol,
+                        deadline + wait_interval,
+                        stop_event=_stop_event,
+                        low=trailing_price * trailing_drop_ratio if trailing_activated else None,
+                        high=(
+                            trailing_price * trailing_update_ratio
+                            if trailing_activated
+                            else entry_price * minimum_profit_ratio
+                        ),
                     )
-
-                    if r.get("retCode") != 0:
-                        error_msg = f"\nError placing sell order: {r.get('retMsg')}"
-                        logging.error(error_msg)
-                        raise Exception(f"Order placement error: {r.get('retMsg')}")
-
-                    order_id = r.get("result", {}).get("orderId")
-                    logging.info(f"Sell order placed successfully. ID: {order_id}")
-
-                    logging.info(f"Closed position at price: {format_price(current_price)} USDT")
-                    logging.info(f"Final profit: {format_price(total_change_from_entry)}%")
-                    entry_price = None
-                    trailing_price = None
-                    position_size = None
-                    trailing_activated = False
-                elif not trailing_activated:
-                    logging.info(f" (Need {minimum_profit_threshold - total_change_from_entry:.2f}% more for trailing activation)")
+                    deadline = time.monotonic()
                 else:
-                    logging.info(" (Monitoring price)")
+                    deadline = wait_next_tick(deadline, check_interval)
 
-            time.sleep(check_interval)
+            except Exception as e:
+                if is_auth_error(e):
+                    logging.error(f"\nAuthentication error, stopping strategy: {str(e)}")
+                    raise
 
-        except Exception as e:
-            consecutive_errors += 1
-            logging.error(f"\nError executing strategy: {str(e)}")
+                consecutive_errors += 1
+                healthy_iterations = 0
+                logging.error(f"\nError executing strategy: {str(e)}")
 
-            if consecutive_errors >= max_consecutive_errors:
-                logging.error(
-                    f"Maximum consecutive errors reached ({max_consecutive_errors}). Restarting strategy..."
+                if consecutive_errors >= max_consecutive_errors:
+                    logging.error(
+                        f"Maximum consecutive errors reached ({max_consecutive_errors}). Restarting strategy..."
+                    )
+                    # Go back to the last saved position, like a restarted bot would
+                    entry_price, trailing_price, position_size, trailing_activated = (
+                        restore_position(saved_position)
+                    )
+                    consecutive_errors = 0
+                    restarts += 1
+                    _stop_event.wait(error_backoff(restarts, RESTART_DELAY))
+                    deadline = time.monotonic()
+                    continue
+
+                logging.warning(
+                    f"Continuing after error. Attempt {consecutive_errors}/{max_consecutive_errors}"
                 )
-                # Reset all position variables
-                entry_price = None
-                trailing_price = None
-                position_size = None
-                trailing_activated = False
-                consecutive_errors = 0
-                time.sleep(30)  # Wait 30 seconds before restart
+                # Back off exponentially on repeated errors
+                _stop_event.wait(error_backoff(consecutive_errors, check_interval))
+                deadline = time.monotonic()
                 continue
+    finally:
+        _active_streams.discard(price_stream)
+        price_stream.stop()
 
-            logging.warning(
-                f"Continuing after error. Attempt {consecutive_errors}/{max_consecutive_errors}"
-            )
-            time.sleep(check_interval * 2)  # Increase wait interval on error
-            continue
+    logging.info(f"Stopped algorithm for {symbol}")
 
 
 def run_trailing_stop_strategy_whitelist(
     helper: BybitHelper,
-    coin_whitelist: list,
+    coin_whitelist: tuple,
     buy_amount: float,
     check_interval: int = 10
 ):
@@ -553,7 +1501,7 @@ def run_trailing_stop_strategy_whitelist(
 
     Args:
         helper: BybitHelper instance
-        coin_whitelist: list of coin names (e.g., ["XRP", "ETH", "BTC"])
+        coin_whitelist: tuple of coin names (e.g., ("XRP", "ETH", "BTC"))
         buy_amount: amount in USDT to buy
         check_interval: price check interval in seconds (default: 10 for whitelist scanning)
     """
@@ -570,13 +1518,13 @@ def run_trailing_stop_strategy_whitelist(
     trailing_update_threshold = 3
     trailing_drop_threshold = -1
     monitoring_period = 1
+    # thresholds as price ratios, so exit decisions are a multiply and compare per tick
+    minimum_profit_ratio = 1 + minimum_profit_threshold / 100
+    trailing_update_ratio = 1 + trailing_update_threshold / 100
+    trailing_drop_ratio = 1 + trailing_drop_threshold / 100
 
     # Position variables
-    current_coin = None
-    entry_price = None
-    trailing_price = None
-    position_size = None
-    trailing_activated = False
+    sell_draft = None
 
     logging.info(f"Starting whitelist algorithm for coins: {coin_whitelist}")
     logging.info(f"Buy amount: {buy_amount} USDT")
@@ -592,278 +1540,416 @@ def run_trailing_stop_strategy_whitelist(
         f"- Trailing drop threshold: {trailing_drop_threshold}%"
     )
 
+    symbols = [f"{coin}USDT" for coin in coin_whitelist]
+
+    # Load instrument specs for all coins before scanning
+    prefetch_instrument_info(helper, category, symbols)
+
+    # Keep recent price history per coin so scans compute price changes locally
+    long_windows = {coin: PriceWindow(hours_period) for coin in coin_whitelist}
+    quick_windows = {coin: PriceWindow(quick_period) for coin in coin_whitelist}
+    for future in [
+        _executor.submit(
+            load_price_history,
+            helper,
+            category,
+            f"{coin}USDT",
+            [long_windows[coin], quick_windows[coin]],
+        )
+        for coin in coin_whitelist
+    ]:
+        future.result()
+
+    # Prices for all coins are pushed over one WebSocket connection
+    price_stream = PriceStream(category, symbols)
+    price_stream.start()
+
+    # Resume a position left open by a previous run
+    state_name = "whitelist"
+    saved_position = load_state(state_name)
+    position = PositionState.from_saved(saved_position)
+    if position.coin is not None:
+        logging.info(
+            f"Resumed position: {format_price(position.position_size)} {position.coin} at {format_price(position.entry_price)} USDT"
+        )
+        # The coin may have been removed from the whitelist since
+        price_stream.add_symbol(f"{position.coin}USDT")
+
     consecutive_errors = 0
     max_consecutive_errors = 5
+    restarts = 0
+    healthy_iterations = 0
+    last_warm_up = time.monotonic()
 
-    while True:
-        try:
-            current_time = datetime.now().strftime("%H:%M:%S")
-
-            if current_coin is None:
-                # WHITELIST SCANNING PHASE
-                logging.info(f"\n[{current_time}] 🔍 Scanning whitelist coins...")
-
-                best_opportunity = None
-                best_score = 0
+    _active_streams.add(price_stream)
+    try:
+        while not _stop_event.is_set():
+            try:
+                slow_wait = None
+                if position.coin is None:
+                    # WHITELIST SCANNING PHASE
+                    logging.info("\n🔍 Scanning whitelist coins...")
+
+                    best_opportunity = None
+
+                    # Current prices for all coins come from the ticker stream,
+                    # or from a single tickers request if any of them is missing
+                    now = time.time()
+                    streamed = [price_stream.get(symbol) for symbol in symbols]
+                    if None in streamed:
+                        tickers = safe_fetch_all_tickers(helper, category)
+                        prices_now = np.fromiter(
+                            (float(tickers.get(symbol, {}).get("lastPrice", "nan")) for symbol in symbols),
+                            dtype=np.float64,
+                            count=len(symbols),
+                        )
+                    else:
+                        tickers = dict.fromkeys(symbols)
+                        prices_now = np.array(streamed, dtype=np.float64)
+                    for coin, price in zip(coin_whitelist, prices_now):
+                        if price > 0:
+                            long_windows[coin].add(now, price)
+                            quick_windows[coin].add(now, price)
+
+                    # Coins without enough local history fall back to server-side price changes.
+                    # Spot tickers only carry 24h statistics (no prevPrice1h / price1hPcnt),
+                    # so those come from candles, cached for a short while per symbol.
+                    # Requests for all such coins go out at once on the shared I/O pool
+                    # and are collected below, so a scan waits about one round-trip
+                    pending = {
+                        coin: submit_price_changes(helper, category, f"{coin}USDT", hours_period, quick_period)
+                        for coin in coin_whitelist
+                        if not (long_windows[coin].is_warm(now) and quick_windows[coin].is_warm(now))
+                    }
+
+                    # Price changes for all coins in one vector operation
+                    long_refs = np.fromiter(
+                        (long_windows[coin].reference() for coin in coin_whitelist),
+                        dtype=np.float64,
+                        count=len(coin_whitelist),
+                    )
+                    quick_refs = np.fromiter(
+                        (quick_windows[coin].reference() for coin in coin_whitelist),
+                        dtype=np.float64,
+                        count=len(coin_whitelist),
+                    )
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        long_changes = (prices_now - long_refs) / long_refs * 100
+                        quick_changes = (prices_now - quick_refs) / quick_refs * 100
+
+                    log_scan = info_enabled()
+                    for i, (coin, symbol) in enumerate(zip(coin_whitelist, symbols)):
+                        try:
+                            if symbol not in tickers:
+                                raise ValueError(f"No ticker data for {symbol}")
+                            if coin in pending:
+                                long_changes[i], quick_changes[i] = (
+                                    future.result() for future in pending[coin]
+                                )
+
+                            if log_scan:
+                                logging.info(
+                                    "  Price: %s USDT (%sh: %s%%, %sh: %s%%)",
+                                    format_price(prices_now[i]),
+                                    hours_period,
+                                    format_price(long_changes[i]),
+                                    quick_period,
+                                    format_price(quick_changes[i]),
+                                    extra={"symbol": symbol},
+                                )
+                        except Exception as e:
+                            logging.warning(f"  Error checking {symbol}: {str(e)}")
+                            prices_now[i] = long_changes[i] = quick_changes[i] = np.nan
+
+                    # Check entry conditions and calculate priority scores:
+                    # higher rise / bigger drop = higher priority, NaN never qualifies
+                    quick_hits = quick_changes >= quick_rise_threshold
+                    drop_hits = ~quick_hits & (long_changes <= price_drop_threshold)
+                    scores = np.where(
+                        quick_hits,
+                        np.abs(quick_changes),
+                        np.where(drop_hits, np.abs(long_changes), 0.0),
+                    )
+                    best = int(scores.argmax())
+
+                    if scores[best] > 0:
+                        if quick_hits[best]:
+                            reason = f"Quick rise {format_price(quick_changes[best])}%"
+                        else:
+                            reason = f"Price drop {format_price(long_changes[best])}%"
+                        best_opportunity = {
+                            'coin': coin_whitelist[best],
+                            'symbol': symbols[best],
+                            'price': float(prices_now[best]),
+                            'reason': reason,
+                            'quick_change': float(quick_changes[best]),
+                            'long_change': float(long_changes[best])
+                        }
+
+                    # If we found an opportunity, execute it
+                    if best_opportunity:
+                        coin = best_opportunity['coin']
+                        symbol = best_opportunity['symbol']
+                        current_price = best_opportunity['price']
+                        reason = best_opportunity['reason']
+
+                        logging.info("\n🎯 ENTRY SIGNAL FOUND!")
+                        logging.info(f"Selected coin: {symbol}")
+                        logging.info(f"Reason: {reason}")
+                        logging.info(f"Price: {format_price(current_price)} USDT")
+                        logging.info("Checking order requirements...")
+
+                        # Check minimum order size before placing order
+                        if not check_minimum_order_size(helper, symbol, buy_amount, current_price):
+                            logging.error(f"Cannot place order for {symbol} - minimum order requirements not met")
+                            logging.info("Continuing whitelist scan...")
+                            # Nothing here waited on I/O; don't rescan at once
+                            _stop_event.wait(check_interval)
+                            continue
+
+                        bought_amount = execute_buy(
+                            helper, None, category, coin, buy_amount, current_price
+                        )
+                        if bought_amount <= 0:
+                            logging.error(f"Buy order for {symbol} was closed without fills")
+                            logging.info("Continuing whitelist scan...")
+                            # Nothing here waited on I/O; don't rescan at once
+                            _stop_event.wait(check_interval)
+                            continue
+
+                        # Set position variables and save them right away, so an
+                        # error below can't lose the position and buy again
+                        position = PositionState(coin, current_price, current_price, bought_amount)
+                        saved_position = persist_position(state_name, asdict(position), saved_position)
+
+                        logging.info(f"🔄 Switched to single-coin mode: {symbol}")
+                        logging.info(f"Entry price: {format_price(position.entry_price)} USDT")
+                        logging.info(f"Position size: {format_price(position.position_size)} {coin}")
+
+                        # Prepare sell order ahead of time for a fast exit
+                        sell_draft = prepare_order(
+                            helper,
+                            category=category,
+                            symbol=symbol,
+                            side="Sell",
+                            order_type="Market",
+                            qty=helper.round_down(position.position_size, get_quantity_decimals(coin, helper)),
+                            market_unit="baseCoin",
+                        )
 
-                # Check all coins in whitelist
-                for coin in coin_whitelist:
-                    symbol = f"{coin}USDT"
+                    else:
+                        logging.info("  ⏳ No entry signals found. Continuing scan...")
 
-                    try:
-                        # Get price data for this coin
-                        current_price = safe_get_price(helper, category, symbol)
-                        price_change = safe_get_price_change(helper, category, symbol, hours=hours_period)
-                        quick_price_change = safe_get_price_change(helper, category, symbol, hours=quick_period)
+                else:
+                    # SINGLE-COIN MANAGEMENT PHASE
+                    symbol = f"{position.coin}USDT"
+                    last_warm_up = keep_connection_warm(helper, last_warm_up)
+
+                    # Get current price and changes
+                    now = time.time()
+                    quick_window = quick_windows.get(position.coin)
+                    # Price change for monitoring period is only shown in the log; if it
+                    # needs a request, run it concurrently with the price request
+                    log_status = info_enabled()
+                    change_future = None
+                    if log_status and not (
+                        monitoring_period == quick_period
+                        and quick_window is not None
+                        and quick_window.is_warm(now)
+                    ):
+                        change_future = _executor.submit(
+                            cached_price_change, helper, category, symbol, monitoring_period
+                        )
+                    current_price = get_current_price(helper, price_stream, category, symbol)
+                    # Keep the coin's history current for the next scan
+                    if quick_window is not None:
+                        long_windows[position.coin].add(now, current_price)
+                        quick_window.add(now, current_price)
+
+                    # Calculate position metrics (for log messages only; decisions
+                    # compare prices against the precomputed threshold ratios)
+                    price_change_from_trailing = (
+                        ((current_price - position.trailing_price) / position.trailing_price) * 100
+                        if position.trailing_price is not None else 0.0
+                    )
+                    total_change_from_entry = (
+                        ((current_price - position.entry_price) / position.entry_price) * 100
+                        if position.entry_price is not None else 0.0
+                    )
 
+                    # Activate trailing stop once minimum profit is reached, and
+                    # decide on the trailing point against the previous one
+                    was_activated = position.trailing_activated
+                    old_trailing = position.trailing_price
+                    position.trailing_price, position.trailing_activated, action = trailing_step(
+                        current_price,
+                        position.entry_price,
+                        position.trailing_price,
+                        position.trailing_activated,
+                        minimum_profit_ratio,
+                        trailing_update_ratio,
+                        trailing_drop_ratio,
+                    )
+                    if position.trailing_activated and not was_activated:
                         logging.info(
-                            f"  {symbol}: {format_price(current_price)} USDT "
-                            f"({hours_period}h: {format_price(price_change)}%, {quick_period}h: {format_price(quick_price_change)}%)"
+                            "\n🟢 Minimum profit reached! Profit: %s%% >= %s%%",
+                            LazyPrice(total_change_from_entry),
+                            minimum_profit_threshold,
                         )
+                        logging.info("Trailing stop mechanism activated!")
 
-                        # Check entry conditions and calculate priority score
-                        score = 0
-                        reason = ""
-
-                        if quick_price_change >= quick_rise_threshold:
-                            score = abs(quick_price_change)  # Higher rise = higher priority
-                            reason = f"Quick rise {format_price(quick_price_change)}%"
-                        elif price_change <= price_drop_threshold:
-                            score = abs(price_change)  # Bigger drop = higher priority
-                            reason = f"Price drop {format_price(price_change)}%"
-
-                        if score > best_score:
-                            best_score = score
-                            best_opportunity = {
-                                'coin': coin,
-                                'symbol': symbol,
-                                'price': current_price,
-                                'reason': reason,
-                                'quick_change': quick_price_change,
-                                'long_change': price_change
-                            }
-
-                    except Exception as e:
-                        logging.warning(f"  Error checking {symbol}: {str(e)}")
-                        continue
-
-                # If we found an opportunity, execute it
-                if best_opportunity:
-                    coin = best_opportunity['coin']
-                    symbol = best_opportunity['symbol']
-                    current_price = best_opportunity['price']
-                    reason = best_opportunity['reason']
-
-                    logging.info("\n🎯 ENTRY SIGNAL FOUND!")
-                    logging.info(f"Selected coin: {symbol}")
-                    logging.info(f"Reason: {reason}")
-                    logging.info(f"Price: {format_price(current_price)} USDT")
-                    logging.info("Checking order requirements...")
-
-                    # Check minimum order size before placing order
-                    if not check_minimum_order_size(helper, symbol, buy_amount):
-                        logging.error(f"Cannot place order for {symbol} - minimum order requirements not met")
-                        logging.info("Continuing whitelist scan...")
-                        continue
-
-                    logging.info("Placing buy order...")
-
-                    # Get wallet balance before buying
-                    balance_before = helper.get_wallet_balance(coin)
-                    logging.info(f"Balance before buying: {format_price(balance_before)} {coin}")
-
-                    # Place buy order
-                    r = safe_place_order(
-                        helper,
-                        category=category,
-                        symbol=symbol,
-                        side="Buy",
-                        order_type="Market",
-                        qty=buy_amount,
-                        market_unit="quoteCoin",
+                    # Far below minimum profit: poll less often and skip the status line
+                    slow_wait = (
+                        None
+                        if position.trailing_activated
+                        else underwater_wait(total_change_from_entry, minimum_profit_threshold, check_interval)
                     )
 
-                    if r.get("retCode") != 0:
-                        error_msg = f"Error placing buy order: {r.get('retMsg')}"
-                        logging.error(error_msg)
-                        raise Exception(f"Order placement error: {r.get('retMsg')}")
-
-                    order_id = r.get("result", {}).get("orderId")
-                    logging.info(f"✅ Buy order placed successfully. ID: {order_id}")
-
-                    # Get wallet balance after buying
-                    balance_after = helper.get_wallet_balance(coin)
-                    logging.info(f"Balance after buying: {format_price(balance_after)} {coin}")
+                    if log_status and slow_wait is None:
+                        if change_future is not None:
+                            monitoring_price_change = change_future.result()
+                        else:
+                            monitoring_price_change = quick_window.change(current_price)
+                        logging.info(
+                            "Price: %s USDT (From entry: %s%%, From trailing: %s%%, Change over %sh: %s%%)",
+                            format_price(current_price),
+                            format_price(total_change_from_entry),
+                            format_price(price_change_from_trailing),
+                            monitoring_period,
+                            format_price(monitoring_price_change),
+                            extra={"symbol": symbol},
+                        )
 
-                    # Calculate exact amount bought
-                    bought_amount = balance_after - balance_before
-                    logging.info(f"Exact amount bought: {format_price(bought_amount)} {coin}")
+                    # Update trailing price if conditions are met
+                    if action == TRAILING_UPDATE:
+                        logging.info(
+                            "\nPrice increased by %s%% from last trailing point.",
+                            LazyPrice(price_change_from_trailing),
+                        )
+                        logging.info(
+                            "Updating trailing point: %s -> %s USDT",
+                            LazyPrice(old_trailing),
+                            LazyPrice(position.trailing_price),
+                        )
+                        logging.info("Total profit from entry: %s%%", LazyPrice(total_change_from_entry))
 
-                    # Set position variables
-                    current_coin = coin
-                    entry_price = current_price
-                    trailing_price = current_price
-                    position_size = bought_amount
-                    trailing_activated = False
+                    # Check exit conditions only if trailing is activated
+                    elif action == TRAILING_SELL:
+                        logging.info(
+                            f"\n🔴 Price dropped by {abs(price_change_from_trailing):.2f}% from trailing point."
+                        )
+                        # Formatted once, logged again after the sell
+                        final_profit = format_price(total_change_from_entry)
+                        logging.info(f"Final profit: {final_profit}% (≥ {minimum_profit_threshold}%)")
+                        logging.info("Placing sell order...")
+
+                        # Use the exact position size that was calculated after buying
+                        if position.position_size is None or position.position_size <= 0:
+                            logging.error(f"No {position.coin} position available for selling")
+                            # Reset position variables since we can't sell
+                            position.reset()
+                            # Drop the saved position too, or a restart would resume it
+                            saved_position = persist_position(
+                                state_name, asdict(position), saved_position
+                            )
+                            continue
+
+                        # Determine decimal places for rounding
+                        decimal_places = get_quantity_decimals(position.coin, helper)
+
+                        sell_quantity = helper.round_down(position.position_size, decimal_places)
+
+                        logging.info(f"Position size to sell: {format_price(position.position_size)} {position.coin}")
+                        logging.info(f"Selling quantity: {format_price(sell_quantity)} {position.coin}")
+
+                        # Place sell order
+                        r = send_order(
+                            helper,
+                            sell_draft,
+                            category=category,
+                            symbol=symbol,
+                            side="Sell",
+                            order_type="Market",
+                            qty=sell_quantity,
+                            market_unit="baseCoin",
+                        )
 
-                    logging.info(f"🔄 Switched to single-coin mode: {symbol}")
-                    logging.info(f"Entry price: {format_price(entry_price)} USDT")
-                    logging.info(f"Position size: {format_price(position_size)} {coin}")
+                        if r.get("retCode") != 0:
+                            error_msg = f"Error placing sell order: {r.get('retMsg')}"
+                            logging.error(error_msg)
+                            raise Exception(f"Order placement error: {r.get('retMsg')}")
 
-                else:
-                    logging.info("  ⏳ No entry signals found. Continuing scan...")
+                        order_id = r.get("result", {}).get("orderId")
+                        logging.info(f"✅ Sell order placed successfully. ID: {order_id}")
 
-            else:
-                # SINGLE-COIN MANAGEMENT PHASE
-                symbol = f"{current_coin}USDT"
+                        logging.info(f"Closed position at price: {format_price(current_price)} USDT")
+                        logging.info(f"Final profit: {final_profit}%")
 
-                # Get current price and changes
-                current_price = safe_get_price(helper, category, symbol)
-                monitoring_price_change = safe_get_price_change(helper, category, symbol, hours=monitoring_period)
+                        # Reset position variables and return to whitelist scanning
+                        position.reset()
 
-                # Calculate position metrics
-                price_change_from_trailing = (
-                    ((current_price - trailing_price) / trailing_price) * 100
-                    if trailing_price is not None else 0.0
-                )
-                total_change_from_entry = (
-                    ((current_price - entry_price) / entry_price) * 100
-                    if entry_price is not None else 0.0
-                )
+                        logging.info("🔄 Returning to whitelist scanning mode...")
 
-                # Determine status
-                if not trailing_activated:
-                    if total_change_from_entry >= minimum_profit_threshold:
-                        trailing_activated = True
+                    elif not position.trailing_activated:
                         logging.info(
-                            f"\n🟢 Minimum profit reached! Profit: {format_price(total_change_from_entry)}% >= {minimum_profit_threshold}%"
+                            " (Need %.2f%% more for trailing activation)",
+                            minimum_profit_threshold - total_change_from_entry,
                         )
-                        logging.info("Trailing stop mechanism activated!")
-                    status_msg = f"(Waiting for {minimum_profit_threshold}% profit)"
-                else:
-                    status_msg = "(Trailing active)"
+                    else:
+                        logging.debug(" (Monitoring price)")
 
-                logging.info(
-                    f"[{current_time}] {symbol} Price: {format_price(current_price)} USDT "
-                    f"(From entry: {format_price(total_change_from_entry)}%, "
-                    f"From trailing: {format_price(price_change_from_trailing)}%, "
-                    f"Change over {monitoring_period}h: {format_price(monitoring_price_change)}%)"
+                # Reset error counters on successful execution; restart backoff
+                # only after a sustained healthy period, so a flapping outage escalates
+                consecutive_errors = 0
+                healthy_iterations += 1
+                if healthy_iterations >= RESTART_RESET_ITERATIONS:
+                    restarts = 0
+
+                saved_position = persist_position(
+                    state_name,
+                    asdict(position),
+                    saved_position,
                 )
 
-                # Check if we can activate trailing stop
-                if not trailing_activated and total_change_from_entry >= minimum_profit_threshold:
-                    trailing_activated = True
-                    logging.info(
-                        f"\n🟢 Minimum profit reached! Profit: {format_price(total_change_from_entry)}% >= {minimum_profit_threshold}%"
+                # Use different intervals for different phases
+                if position.coin:
+                    # Wake up on the tick that crosses a trailing level instead of the next poll
+                    price_stream.wait_for_cross(
+                        f"{position.coin}USDT",
+                        time.monotonic() + (slow_wait or 5),
+                        low=position.trailing_price * trailing_drop_ratio if position.trailing_activated else None,
+                        high=(
+                            position.trailing_price * trailing_update_ratio
+                            if position.trailing_activated
+                            else position.entry_price * minimum_profit_ratio
+                        ),
+                        stop_event=_stop_event,
                     )
-                    logging.info("Trailing stop mechanism activated!")
-
-                # Update trailing price if conditions are met
-                if price_change_from_trailing >= trailing_update_threshold:
-                    old_trailing = trailing_price
-                    trailing_price = current_price
-                    logging.info(
-                        f"\nPrice increased by {format_price(price_change_from_trailing)}% from last trailing point."
-                    )
-                    logging.info(
-                        f"Updating trailing point: {format_price(old_trailing)} -> {format_price(trailing_price)} USDT"
-                    )
-                    logging.info(f"Total profit from entry: {format_price(total_change_from_entry)}%")
-
-                # Check exit conditions only if trailing is activated
-                elif trailing_activated and price_change_from_trailing <= trailing_drop_threshold:
-                    logging.info(
-                        f"\n🔴 Price dropped by {abs(price_change_from_trailing):.2f}% from trailing point."
-                    )
-                    logging.info(f"Final profit: {format_price(total_change_from_entry)}% (≥ {minimum_profit_threshold}%)")
-                    logging.info("Placing sell order...")
-
-                    # Use the exact position_size that was calculated after buying
-                    if position_size is None or position_size <= 0:
-                        logging.error(f"No {current_coin} position available for selling")
-                        # Reset position variables since we can't sell
-                        current_coin = None
-                        entry_price = None
-                        trailing_price = None
-                        position_size = None
-                        trailing_activated = False
-                        continue
-
-                    # Determine decimal places for rounding
-                    if current_coin in ["BTC", "ETH"]:
-                        decimal_places = 6
-                    elif current_coin in ["XRP", "ADA", "DOGE", "TRX"]:
-                        decimal_places = 1
-                    else:
-                        decimal_places = 2
-
-                    sell_quantity = helper.round_down(position_size, decimal_places)
-
-                    logging.info(f"Position size to sell: {format_price(position_size)} {current_coin}")
-                    logging.info(f"Selling quantity: {format_price(sell_quantity)} {current_coin}")
-
-                    # Place sell order
-                    r = safe_place_order(
-                        helper,
-                        category=category,
-                        symbol=symbol,
-                        side="Sell",
-                        order_type="Market",
-                        qty=sell_quantity,
-                        market_unit="baseCoin",
-                    )
-
-                    if r.get("retCode") != 0:
-                        error_msg = f"Error placing sell order: {r.get('retMsg')}"
-                        logging.error(error_msg)
-                        raise Exception(f"Order placement error: {r.get('retMsg')}")
-
-                    order_id = r.get("result", {}).get("orderId")
-                    logging.info(f"✅ Sell order placed successfully. ID: {order_id}")
-
-                    logging.info(f"Closed position at price: {format_price(current_price)} USDT")
-                    logging.info(f"Final profit: {format_price(total_change_from_entry)}%")
-
-                    # Reset position variables and return to whitelist scanning
-                    current_coin = None
-                    entry_price = None
-                    trailing_price = None
-                    position_size = None
-                    trailing_activated = False
-
-                    logging.info("🔄 Returning to whitelist scanning mode...")
-
-                elif not trailing_activated:
-                    needed_profit = minimum_profit_threshold - total_change_from_entry
-                    logging.info(f" (Need {needed_profit:.2f}% more for trailing activation)")
                 else:
-                    logging.info(" (Monitoring price)")
-
-            # Reset error counter on successful execution
-            consecutive_errors = 0
+                    _stop_event.wait(check_interval)
 
-            # Use different intervals for different phases
-            sleep_interval = 5 if current_coin else check_interval
-            time.sleep(sleep_interval)
+            except Exception as e:
+                consecutive_errors += 1
+                healthy_iterations = 0
+                logging.error(f"\nError executing whitelist strategy: {str(e)}")
 
-        except Exception as e:
-            consecutive_errors += 1
-            logging.error(f"\nError executing whitelist strategy: {str(e)}")
-
-            if consecutive_errors >= max_consecutive_errors:
-                logging.error(
-                    f"Maximum consecutive errors reached ({max_consecutive_errors}). Restarting strategy..."
-                )
-                # Reset all position variables
-                current_coin = None
-                entry_price = None
-                trailing_price = None
-                position_size = None
-                trailing_activated = False
-                consecutive_errors = 0
-                time.sleep(30)
+                if consecutive_errors >= max_consecutive_errors:
+                    logging.error(
+                        f"Maximum consecutive errors reached ({max_consecutive_errors}). Restarting strategy..."
+                    )
+                    # Go back to the last saved position, like a restarted bot would
+                    position = PositionState.from_saved(saved_position)
+                    consecutive_errors = 0
+                    restarts += 1
+                    _stop_event.wait(error_backoff(restarts, RESTART_DELAY))
+                    continue
+
+                logging.warning(f"Continuing after error. Attempt {consecutive_errors}/{max_consecutive_errors}")
+                # Back off exponentially on repeated errors
+                _stop_event.wait(error_backoff(consecutive_errors, check_interval))
                 continue
+    finally:
+        _active_streams.discard(price_stream)
+        price_stream.stop()
 
-            logging.warning(f"Continuing after error. Attempt {consecutive_errors}/{max_consecutive_errors}")
-            time.sleep(check_interval * 2)
-            continue
+    logging.info("Stopped whitelist algorithm")
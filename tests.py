@@ -17,6 +17,12 @@ def test_connection(helper: BybitHelper, coin="XRP"):
         helper: BybitHelper instance
         coin: coin name (e.g., "XRP", "ETH3L") - defaults to "XRP" if not provided
     """
+    logging.info("0. Warm up API connection")
+    helper.warm_up_connection()
+    logging.info("----------------")
+
+    symbol = f"{coin}USDT"
+
     logging.info("1. Get all balance")
     helper.assets()
     logging.info("----------------")
@@ -26,7 +32,6 @@ def test_connection(helper: BybitHelper, coin="XRP"):
     logging.info(str(avbl))
     logging.info("----------------")
 
-    symbol = f"{coin}USDT"
     logging.info(f"3. Get price ({symbol})")
     r = helper.get_instrument_info(category="spot", symbol=symbol)
     logging.info(str(r))